@@ -1,24 +1,152 @@
 """Samsung Climate integration for Home Assistant."""
 from __future__ import annotations
 
+import logging
+import os
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
+
+from .api import SamsungClient
+from .capabilities import CapabilityStore
+from .const import (
+    CONF_CERT_PATH,
+    CONF_COMMAND_WINDOW,
+    CONF_LOCAL_PUSH,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_TRAFFIC,
+    DEFAULT_CERT_PATH,
+    DEFAULT_COMMAND_WINDOW,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DATA_CAPABILITIES,
+    DATA_PUSH,
+    DATA_SCHEDULER,
+    DEFAULT_LOCAL_PUSH,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RECORD_TRAFFIC,
+    DOMAIN,
+    PLATFORMS,
+)
+from .coordinator import SamsungClimateCoordinator
+from .push import PUSH_PORT, PushListener
+from .recorder import TrafficRecorder
+from .scheduler import PollScheduler
+from .services import async_setup_services
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
-from .const import DOMAIN, PLATFORMS
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Samsung Climate services and load the stored capabilities."""
+    capabilities = CapabilityStore(hass)
+    await capabilities.async_load()
+    hass.data.setdefault(DOMAIN, {})[DATA_CAPABILITIES] = capabilities
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Samsung Climate from a config entry."""
+    data = entry.data
+
+    # If cert_path is relative, make it relative to this component directory
+    cert_path = data.get(CONF_CERT_PATH, DEFAULT_CERT_PATH)
+    if not os.path.isabs(cert_path):
+        component_dir = os.path.dirname(os.path.abspath(__file__))
+        cert_path = os.path.join(component_dir, cert_path)
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    if (scheduler := hass.data[DOMAIN].get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DOMAIN][DATA_SCHEDULER] = PollScheduler()
+    # Stagger the first poll of every entry instead of polling all ACs at boot
+    delay = scheduler.register(entry.entry_id)
+
+    recorder = None
+    if entry.options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC):
+        path = hass.config.path(DOMAIN, f"{data['host']}_{data['port']}.ndjson")
+        recorder = TrafficRecorder(path, redact=[data["token"]])
+        _LOGGER.info("Recording the traffic with %s to %s", data["host"], path)
+
+    client = SamsungClient(
+        data["host"], data["port"], data["token"], cert_path, recorder=recorder
+    )
+    coordinator = SamsungClimateCoordinator(
+        hass,
+        client,
+        entry.entry_id,
+        scheduler,
+        hass.data[DOMAIN][DATA_CAPABILITIES],
+        command_window=entry.options.get(CONF_COMMAND_WINDOW, DEFAULT_COMMAND_WINDOW),
+        min_interval=entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+        max_interval=entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+    )
 
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    if entry.options.get(CONF_LOCAL_PUSH, DEFAULT_LOCAL_PUSH):
+        await _async_setup_push(hass, coordinator, cert_path)
+
+    # Entities start from their restored state, the first refresh runs in the
+    # background so an unreachable AC never delays or fails the setup
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    @callback
+    def _async_first_refresh(_now: Any) -> None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+        )
+
+    entry.async_on_unload(async_call_later(hass, delay, _async_first_refresh))
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
 
+async def _async_setup_push(
+    hass: HomeAssistant, coordinator: SamsungClimateCoordinator, cert_path: str
+) -> None:
+    """Receive the AC's notifications, polling stays as a slow fallback."""
+    if (listener := hass.data[DOMAIN].get(DATA_PUSH)) is None:
+        listener = PushListener(hass)
+        try:
+            await listener.async_start(cert_path)
+        except OSError as ex:
+            _LOGGER.error(
+                "Cannot listen for notifications on port %s, polling instead: %s", PUSH_PORT, ex
+            )
+            return
+        hass.data[DOMAIN][DATA_PUSH] = listener
+    listener.async_register(coordinator.client.host, coordinator.async_handle_push)
+    coordinator.push = True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SamsungClimateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if (listener := hass.data[DOMAIN].get(DATA_PUSH)) is not None:
+            listener.async_unregister(coordinator.async_handle_push)
+            if listener.empty:
+                hass.data[DOMAIN].pop(DATA_PUSH)
+                await listener.async_stop()
+        await coordinator.async_close()
+        if coordinator.scheduler.empty:
+            hass.data[DOMAIN].pop(DATA_SCHEDULER)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the capabilities of the devices of a removed entry."""
+    if (capabilities := hass.data.get(DOMAIN, {}).get(DATA_CAPABILITIES)) is not None:
+        capabilities.async_remove_entry(entry.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,803 @@
+"""Low level helpers to talk to the Samsung air conditioner REST API."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import os
+import ssl
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .recorder import TrafficRecorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often (seconds) a cached SSL context re-checks the certificate mtime
+SSL_CONTEXT_RECHECK_INTERVAL = 60
+
+# Reused connections dropped in a row before keep-alive is given up
+MAX_DROPPED_REUSES = 3
+
+# Largest response accepted from a device, headers included
+MAX_RESPONSE_SIZE = 256 * 1024
+
+_READ_CHUNK_SIZE = 16 * 1024
+
+# Number of request timings kept per client
+TIMING_HISTORY = 100
+
+# Deadlines (seconds) for each phase of a request
+CONNECT_TIMEOUT = 5
+HANDSHAKE_TIMEOUT = 10
+READ_TIMEOUT = 10
+
+# Request priorities, lower values are sent first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+# Consecutive failures before requests to a host are paused
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Initial and maximum pause (seconds), doubled after every failed probe
+CIRCUIT_COOLDOWN = 30
+CIRCUIT_MAX_COOLDOWN = 600
+
+
+class HttpProtocolError(Exception):
+    """Error to indicate the device sent a malformed HTTP response."""
+
+
+class ResponseTooLarge(HttpProtocolError):
+    """Error to indicate the response exceeds the maximum allowed size."""
+
+
+class CircuitOpenError(Exception):
+    """Error to indicate requests are paused after repeated failures."""
+
+
+# Errors meaning the device did not answer properly
+CONNECTION_ERRORS = (OSError, asyncio.IncompleteReadError, HttpProtocolError)
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    """Response received from the device."""
+
+    status: int
+    reason: str
+    version: str
+    headers: dict[str, str]
+    body: bytes
+    # time.perf_counter() when the status line and headers were received
+    received: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return True for a 2xx status."""
+        return 200 <= self.status < 300
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return True if the connection can be reused after this response."""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+class _ResponseReader:
+    """Incremental HTTP/1.1 response reader bound to a size budget."""
+
+    def __init__(self, reader: asyncio.StreamReader, max_size: int) -> None:
+        """Initialize the reader."""
+        self._reader = reader
+        self._remaining = max_size
+
+    def _consume(self, size: int) -> None:
+        """Charge ``size`` bytes against the budget."""
+        self._remaining -= size
+        if self._remaining < 0:
+            raise ResponseTooLarge("Response exceeds maximum size")
+
+    async def readline(self) -> bytes:
+        """Read one CRLF terminated line, without the terminator."""
+        try:
+            line = await self._reader.readuntil(b"\r\n")
+        except asyncio.LimitOverrunError as ex:
+            raise HttpProtocolError("Response line too long") from ex
+        self._consume(len(line))
+        return line[:-2]
+
+    async def readexactly(self, size: int) -> bytes:
+        """Read exactly ``size`` bytes."""
+        self._consume(size)
+        return await self._reader.readexactly(size)
+
+    async def read_to_eof(self) -> bytes:
+        """Read until the device closes the connection."""
+        chunks = []
+        while chunk := await self._reader.read(_READ_CHUNK_SIZE):
+            self._consume(len(chunk))
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+async def async_read_response(
+    reader: asyncio.StreamReader,
+    method: str = "GET",
+    max_size: int = MAX_RESPONSE_SIZE,
+) -> HttpResponse:
+    """Read one HTTP/1.x response from the stream.
+
+    The body is framed by Content-Length or chunked transfer encoding and
+    only falls back to reading until EOF when neither is present.
+    """
+    stream = _ResponseReader(reader, max_size)
+
+    status_line = await stream.readline()
+    parts = status_line.split(b" ", 2)
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/1.") or not parts[1].isdigit():
+        raise HttpProtocolError(f"Invalid status line: {status_line[:64]!r}")
+    try:
+        version = parts[0].decode("ascii")
+    except UnicodeDecodeError as ex:
+        raise HttpProtocolError(f"Invalid status line: {status_line[:64]!r}") from ex
+    status = int(parts[1])
+    reason = parts[2].decode("latin-1") if len(parts) > 2 else ""
+
+    headers: dict[str, str] = {}
+    while line := await stream.readline():
+        name, sep, value = line.partition(b":")
+        if not sep:
+            raise HttpProtocolError(f"Invalid header line: {line[:64]!r}")
+        headers[name.strip().decode("latin-1").lower()] = value.strip().decode("latin-1")
+    received = time.perf_counter()
+
+    if method == "HEAD" or status < 200 or status in (204, 304):
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        while True:
+            size_line = await stream.readline()
+            try:
+                size = int(size_line.split(b";", 1)[0], 16)
+            except ValueError as ex:
+                raise HttpProtocolError(f"Invalid chunk size: {size_line[:64]!r}") from ex
+            if size == 0:
+                break
+            chunks.append(await stream.readexactly(size))
+            if await stream.readline():
+                raise HttpProtocolError("Missing CRLF after chunk")
+        # Skip optional trailers
+        while await stream.readline():
+            pass
+        body = b"".join(chunks)
+    elif (length := headers.get("content-length")) is not None:
+        if not (length.isascii() and length.isdigit()):
+            raise HttpProtocolError(f"Invalid Content-Length: {length!r}")
+        body = await stream.readexactly(int(length))
+    else:
+        # No framing information, the body ends when the device closes
+        body = await stream.read_to_eof()
+        headers["connection"] = "close"
+
+    return HttpResponse(status, reason, version, headers, body, received)
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """Phases of one request, durations in seconds."""
+
+    method: str
+    path: str
+    timestamp: float
+    queue: float = 0.0
+    connect: float = 0.0
+    handshake: float = 0.0
+    ttfb: float = 0.0
+    transfer: float = 0.0
+    total: float = 0.0
+    reused: bool = False
+    resumed: bool = False
+    status: int | None = None
+    error: str | None = None
+
+
+@dataclass(order=True, slots=True)
+class _QueuedRequest:
+    """A request waiting for its turn on the client's connection."""
+
+    priority: int
+    sequence: int
+    method: str = field(compare=False)
+    path: str = field(compare=False)
+    data: str | None = field(compare=False)
+    timing: RequestTiming = field(compare=False)
+    future: asyncio.Future[HttpResponse] = field(compare=False)
+    queued: float = field(compare=False)
+
+
+# TLS session offered by the connection being opened in the current task
+_OFFERED_SESSION: ContextVar[ssl.SSLSession | None] = ContextVar(
+    "samsung_climate_tls_session", default=None
+)
+
+
+class _ResumableSSLContext(ssl.SSLContext):
+    """SSL context offering the session of the previous connection.
+
+    asyncio does not let callers pass a session to start_tls, so the client
+    sets _OFFERED_SESSION around the call and the SSL object is created with
+    it. The handshake falls back to a full one if the device declines.
+    """
+
+    def wrap_bio(
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,
+        server_hostname: str | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        """Wrap the BIO pair, offering the pending session if any."""
+        if session is None and not server_side:
+            session = _OFFERED_SESSION.get()
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
+
+
+@dataclass
+class _CachedSSLContext:
+    """SSL context built for a given certificate revision."""
+
+    mtime: float
+    context: ssl.SSLContext
+    checked: float
+
+
+_SSL_CONTEXTS: dict[str, _CachedSSLContext] = {}
+_SSL_CONTEXTS_LOCK = asyncio.Lock()
+
+
+def _create_ssl_context(cert_path: str) -> ssl.SSLContext:
+    """Create the client SSL context used for the AC (blocking)."""
+    # Use SSLContext constructor directly to avoid set_default_verify_paths
+    sslcontext = _ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    # Allow weak certificates and signatures for older devices
+    sslcontext.set_ciphers('DEFAULT:@SECLEVEL=0')
+    sslcontext.check_hostname = False
+    sslcontext.verify_mode = ssl.CERT_NONE
+
+    # Enable older TLS versions for compatibility with old devices
+    sslcontext.minimum_version = ssl.TLSVersion.TLSv1
+    sslcontext.maximum_version = ssl.TLSVersion.TLSv1_3
+
+    # Set additional options for compatibility
+    sslcontext.options |= ssl.OP_LEGACY_SERVER_CONNECT
+
+    try:
+        sslcontext.load_cert_chain(cert_path)
+    except ssl.SSLError as ssl_ex:
+        # Continue without client certificate if loading fails
+        _LOGGER.warning("SSL certificate load failed: %s", ssl_ex)
+    return sslcontext
+
+
+def _refresh_ssl_context(
+    cert_path: str, cached: _CachedSSLContext | None
+) -> _CachedSSLContext:
+    """Return a context for the current revision of the certificate (blocking)."""
+    mtime = os.stat(cert_path).st_mtime
+    if cached is not None and cached.mtime == mtime:
+        cached.checked = time.monotonic()
+        return cached
+
+    _LOGGER.debug("Loading SSL certificate %s", cert_path)
+    return _CachedSSLContext(mtime, _create_ssl_context(cert_path), time.monotonic())
+
+
+async def async_get_ssl_context(cert_path: str) -> ssl.SSLContext:
+    """Return the process wide SSL context for a certificate.
+
+    The context is built once in the executor and shared by every client
+    using the same certificate. It is rebuilt when the file mtime changes.
+    """
+    cached = _SSL_CONTEXTS.get(cert_path)
+    if (
+        cached is not None
+        and time.monotonic() - cached.checked < SSL_CONTEXT_RECHECK_INTERVAL
+    ):
+        return cached.context
+
+    async with _SSL_CONTEXTS_LOCK:
+        cached = _SSL_CONTEXTS.get(cert_path)
+        if (
+            cached is not None
+            and time.monotonic() - cached.checked < SSL_CONTEXT_RECHECK_INTERVAL
+        ):
+            return cached.context
+
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(
+            None, _refresh_ssl_context, cert_path, cached
+        )
+        _SSL_CONTEXTS[cert_path] = cached
+        return cached.context
+
+
+@asynccontextmanager
+async def _deadline(seconds: float, action: str) -> AsyncIterator[None]:
+    """Fail with a descriptive TimeoutError if the block takes too long."""
+    try:
+        async with asyncio.timeout(seconds):
+            yield
+    except TimeoutError as ex:
+        raise TimeoutError(f"Timed out after {seconds}s {action}") from ex
+
+
+class CircuitBreaker:
+    """Pause requests to a host that keeps failing.
+
+    After ``threshold`` consecutive failures the circuit opens and requests
+    fail immediately for a cooldown. The first request after the cooldown is
+    a probe: success closes the circuit, failure reopens it with a doubled
+    cooldown. Opening and recovery are logged once per outage.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._name = name
+        self._threshold = threshold
+        self._initial_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.rejected = 0
+        self._opened_at = 0.0
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError if the request must not be attempted."""
+        if self.state != self.OPEN:
+            return
+        remaining = self._opened_at + self.cooldown - time.monotonic()
+        if remaining > 0:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Requests to {self._name} paused for another {remaining:.0f}s"
+            )
+        self.state = self.HALF_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.state != self.CLOSED:
+            _LOGGER.info("%s is reachable again", self._name)
+        self.state = self.CLOSED
+        self.failures = 0
+        self.cooldown = self._initial_cooldown
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count a failed request, opening the circuit when needed."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self._max_cooldown)
+            _LOGGER.debug(
+                "Probe to %s failed, pausing requests for %ss: %s", self._name, self.cooldown, error
+            )
+        elif self.state == self.CLOSED and self.failures >= self._threshold:
+            _LOGGER.warning(
+                "%s failed %s requests in a row, pausing requests for %ss: %s",
+                self._name,
+                self.failures,
+                self.cooldown,
+                error,
+            )
+        else:
+            _LOGGER.debug("Request to %s failed: %s", self._name, error)
+            return
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+
+
+class SamsungClient:
+    """HTTPS client for a single AC that keeps its TLS connection alive.
+
+    Requests are queued and sent one at a time by a single worker over one
+    connection which is reused for polls and commands. Commands go ahead of
+    queued polls, and a queued poll is answered with the response of a poll
+    sent after it was queued instead of being sent again. A dropped
+    connection is re-established transparently and firmware that does not
+    honour keep-alive falls back to one connection per request. New
+    connections offer the TLS session of the previous one, so the handshake
+    is abbreviated on firmware that supports session resumption.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        token: str,
+        cert_path: str,
+        max_response_size: int = MAX_RESPONSE_SIZE,
+        recorder: TrafficRecorder | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        With a recorder every exchange with the device is recorded, see
+        recorder.TrafficRecorder.
+        """
+        self.host = host
+        self.port = int(port)
+        self._token = token
+        self._cert_path = cert_path
+        self._max_response_size = max_response_size
+        self.recorder = recorder
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._queue: list[_QueuedRequest] = []
+        self._sequence = itertools.count()
+        self._worker: asyncio.Task[None] | None = None
+        # Send time, path and response of the latest successful poll
+        self._last_poll: tuple[float, str, HttpResponse] | None = None
+        self.keep_alive = True
+        self._dropped_reuses = 0
+        self.resumption = True
+        # Context and TLS session of the latest connection
+        self._tls_session: tuple[ssl.SSLContext, ssl.SSLSession] | None = None
+        self.session_hits = 0
+        self.session_misses = 0
+        self.timings: deque[RequestTiming] = deque(maxlen=TIMING_HISTORY)
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.coalesced = 0
+        self.circuit = CircuitBreaker(f"{host}:{self.port}")
+
+    @property
+    def connected(self) -> bool:
+        """Return True if an open connection is available for reuse."""
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        )
+
+    async def async_request(
+        self,
+        method: str = "GET",
+        path: str = "",
+        data: str | None = None,
+        priority: int | None = None,
+    ) -> HttpResponse:
+        """Queue a request to /devices{path} and return the response.
+
+        GET requests are polls and default to PRIORITY_POLL, anything else is
+        a command and defaults to PRIORITY_COMMAND.
+        """
+        if priority is None:
+            priority = PRIORITY_POLL if method == "GET" else PRIORITY_COMMAND
+        loop = asyncio.get_running_loop()
+        request = _QueuedRequest(
+            priority,
+            next(self._sequence),
+            method,
+            path,
+            data,
+            RequestTiming(method, path, time.time()),
+            loop.create_future(),
+            time.perf_counter(),
+        )
+        heapq.heappush(self._queue, request)
+        if self._worker is None:
+            self._worker = loop.create_task(self._async_run_queue())
+        return await request.future
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting to be sent."""
+        return sum(not request.future.done() for request in self._queue)
+
+    async def _async_run_queue(self) -> None:
+        """Send queued requests one at a time until the queue is empty."""
+        try:
+            while self._queue:
+                request = heapq.heappop(self._queue)
+                if request.future.done():
+                    continue  # The caller gave up waiting
+                if (response := self._fresh_poll(request)) is not None:
+                    self.coalesced += 1
+                    request.future.set_result(response)
+                    continue
+                try:
+                    response = await self._async_send(request)
+                except Exception as ex:  # pylint: disable=broad-except
+                    if not request.future.done():
+                        request.future.set_exception(ex)
+                else:
+                    if not request.future.done():
+                        request.future.set_result(response)
+        finally:
+            self._worker = None
+
+    def _fresh_poll(self, request: _QueuedRequest) -> HttpResponse | None:
+        """Return the response of a poll sent after request was queued."""
+        if request.method != "GET" or self._last_poll is None:
+            return None
+        sent, path, response = self._last_poll
+        if path == request.path and sent > request.queued:
+            return response
+        return None
+
+    async def _async_send(self, request: _QueuedRequest) -> HttpResponse:
+        """Send a dequeued request and record its timing.
+
+        Requests rejected by the open circuit are not sent, so they are not
+        counted, timed or recorded.
+        """
+        method, path, data, timing = request.method, request.path, request.data, request.timing
+        start = request.queued
+        response: HttpResponse | None = None
+        async with self._lock:
+            self.circuit.before_request()
+            sent = time.perf_counter()
+            timing.queue = sent - start
+            self.requests += 1
+            try:
+                try:
+                    response = await self._async_request(method, path, data, timing)
+                except CONNECTION_ERRORS as ex:
+                    self.circuit.record_failure(ex)
+                    raise
+                self.circuit.record_success()
+                timing.status = response.status
+            except Exception as ex:
+                self.errors += 1
+                timing.error = str(ex) or type(ex).__name__
+                raise
+            finally:
+                timing.total = time.perf_counter() - start
+                self.timings.append(timing)
+                if self.recorder is not None:
+                    self.recorder.record(self._exchange_record(request, response))
+        if method == "GET" and response.ok:
+            self._last_poll = (sent, path, response)
+        return response
+
+    async def _async_request(
+        self, method: str, path: str, data: str | None, timing: RequestTiming
+    ) -> HttpResponse:
+        """Send a request, reconnecting once if a reused connection was dropped."""
+        reused = timing.reused = self.connected
+        if not reused:
+            self._drop_connection()
+            await self._async_connect(timing)
+
+        try:
+            return await self._async_exchange(method, path, data, timing)
+        except (ConnectionError, asyncio.IncompleteReadError) as ex:
+            self._drop_connection()
+            if not reused:
+                raise
+            # The device closed the idle connection, retry on a fresh one
+            _LOGGER.debug("Connection to %s was dropped, reconnecting: %s", self.host, ex)
+            self._dropped_reuses += 1
+            if self._dropped_reuses >= MAX_DROPPED_REUSES:
+                self._disable_keep_alive()
+        except BaseException:
+            self._drop_connection()
+            raise
+
+        timing.reused = False
+        await self._async_connect(timing)
+        try:
+            return await self._async_exchange(method, path, data, timing)
+        except BaseException:
+            self._drop_connection()
+            raise
+
+    def _exchange_record(
+        self, request: _QueuedRequest, response: HttpResponse | None
+    ) -> dict[str, Any]:
+        """Return the recording of one exchange, see tools/replay.py."""
+        timing = request.timing
+        record: dict[str, Any] = {
+            "ts": round(timing.timestamp, 3),
+            "host": self.host,
+            "port": self.port,
+            "method": request.method,
+            "path": f"/devices{request.path}",
+            "reused": timing.reused,
+            "resumed": timing.resumed,
+            "timing": {
+                phase: round(getattr(timing, phase), 6)
+                for phase in ("queue", "connect", "handshake", "ttfb", "transfer", "total")
+            },
+        }
+        if request.data:
+            record["request"] = request.data
+        if response is not None:
+            record["status"] = response.status
+            record["reason"] = response.reason
+            record["headers"] = response.headers
+            record["body"] = response.body.decode("utf-8", errors="replace")
+        if timing.error is not None:
+            record["error"] = timing.error
+        return record
+
+    @property
+    def reconnects(self) -> int:
+        """Return the number of connections opened after the first one."""
+        return max(0, self.connections - 1)
+
+    def last_timing(self, method: str = "GET") -> RequestTiming | None:
+        """Return the timing of the latest request with this method."""
+        return next((timing for timing in reversed(self.timings) if timing.method == method), None)
+
+    @property
+    def error_rate(self) -> float:
+        """Return the share of failed requests among the recent ones."""
+        if not self.timings:
+            return 0.0
+        return sum(timing.error is not None for timing in self.timings) / len(self.timings)
+
+    async def async_close(self) -> None:
+        """Fail the queued requests and close the connection to the device."""
+        queue, self._queue = self._queue, []
+        for request in queue:
+            if not request.future.done():
+                request.future.set_exception(
+                    ConnectionError(f"Client for {self.host} was closed")
+                )
+        async with self._lock:
+            if (writer := self._writer) is None:
+                return
+            self._drop_connection()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                # Devices often drop the socket without a TLS close_notify
+                pass
+
+    async def _async_connect(self, timing: RequestTiming) -> None:
+        """Open a new TLS connection to the device.
+
+        If the handshake fails while resuming a session, resumption is
+        disabled and the connection retried with a full handshake.
+        """
+        sslcontext = await async_get_ssl_context(self._cert_path)
+        session = None
+        if self.resumption and self._tls_session is not None:
+            context, session = self._tls_session
+            if context is not sslcontext:
+                session = None  # The certificate was reloaded since
+
+        reader, writer = await self._async_open(timing)
+        try:
+            await self._async_handshake(writer, sslcontext, session, timing)
+        except (ssl.SSLError, ConnectionError) as ex:
+            if session is None:
+                raise
+            _LOGGER.debug("TLS session resumption with %s failed, disabling it: %s", self.host, ex)
+            self._disable_resumption()
+            session = None
+            reader, writer = await self._async_open(timing)
+            await self._async_handshake(writer, sslcontext, None, timing)
+
+        if session is not None:
+            if writer.get_extra_info("ssl_object").session_reused:
+                self.session_hits += 1
+                timing.resumed = True
+            else:
+                self.session_misses += 1
+        self.connections += 1
+        self._reader, self._writer = reader, writer
+
+    async def _async_open(
+        self, timing: RequestTiming
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open the TCP connection to the device."""
+        start = time.perf_counter()
+        async with _deadline(CONNECT_TIMEOUT, f"connecting to {self.host}"):
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        timing.connect += time.perf_counter() - start
+        return reader, writer
+
+    async def _async_handshake(
+        self,
+        writer: asyncio.StreamWriter,
+        sslcontext: ssl.SSLContext,
+        session: ssl.SSLSession | None,
+        timing: RequestTiming,
+    ) -> None:
+        """Run the TLS handshake on an open connection, offering session if given."""
+        start = time.perf_counter()
+        offered = _OFFERED_SESSION.set(session)
+        try:
+            async with _deadline(HANDSHAKE_TIMEOUT, f"in the TLS handshake with {self.host}"):
+                await writer.start_tls(sslcontext)
+        except BaseException:
+            writer.close()
+            raise
+        finally:
+            _OFFERED_SESSION.reset(offered)
+        timing.handshake += time.perf_counter() - start
+
+    def _remember_session(self) -> None:
+        """Keep the TLS session of the current connection for the next one."""
+        if not self.resumption or self._writer is None:
+            return
+        ssl_object = self._writer.get_extra_info("ssl_object")
+        if ssl_object is not None and (session := ssl_object.session) is not None:
+            self._tls_session = (ssl_object.context, session)
+
+    def _disable_resumption(self) -> None:
+        """Always use a full TLS handshake."""
+        self.resumption = False
+        self._tls_session = None
+
+    def _drop_connection(self) -> None:
+        """Close the current connection, if any, without waiting."""
+        if (writer := self._writer) is not None:
+            self._reader = self._writer = None
+            writer.close()
+
+    def _disable_keep_alive(self) -> None:
+        """Fall back to one connection per request."""
+        if self.keep_alive:
+            _LOGGER.debug("%s does not support keep-alive, using one connection per request", self.host)
+            self.keep_alive = False
+
+    def _build_request(self, method: str, path: str, data: str | None) -> bytes:
+        """Build the raw HTTP request."""
+        request = f"{method} /devices{path} HTTP/1.1\r\n"
+        request += f"Host: {self.host}:{self.port}\r\n"
+        request += f"Authorization: Bearer {self._token}\r\n"
+
+        body = data.encode() if data else b""
+        if body:
+            request += f"Content-Length: {len(body)}\r\n"
+            request += "Content-Type: application/json\r\n"
+
+        request += "Connection: keep-alive\r\n" if self.keep_alive else "Connection: close\r\n"
+        request += "\r\n"
+        return request.encode() + body
+
+    async def _async_exchange(
+        self, method: str, path: str, data: str | None, timing: RequestTiming
+    ) -> HttpResponse:
+        """Send one request on the open connection and read its response."""
+        start = time.perf_counter()
+        writer = self._writer
+        async with _deadline(READ_TIMEOUT, f"waiting for {self.host} to respond"):
+            writer.write(self._build_request(method, path, data))
+            await writer.drain()
+            response = await async_read_response(self._reader, method, self._max_response_size)
+        timing.ttfb = response.received - start
+        timing.transfer = time.perf_counter() - response.received
+        # TLS 1.3 session tickets arrive after the handshake, with the data
+        self._remember_session()
+
+        if self.keep_alive and response.keep_alive:
+            self._dropped_reuses = 0
+        else:
+            self._disable_keep_alive()
+            self._drop_connection()
+
+        return response
@@ -0,0 +1,90 @@
+"""Binary sensor platform for the Samsung Climate integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import SamsungClimateCoordinator
+from .entity import SamsungDeviceEntity, async_track_devices
+from .model import DeviceState
+
+
+@dataclass(frozen=True, kw_only=True)
+class SamsungBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a binary sensor read from the device state.
+
+    The binary sensor is only created for devices whose payload has a value.
+    """
+
+    is_on_fn: Callable[[DeviceState], bool | None]
+
+
+BINARY_SENSORS: tuple[SamsungBinarySensorEntityDescription, ...] = (
+    SamsungBinarySensorEntityDescription(
+        key="filter_alarm",
+        name="Filter",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        is_on_fn=lambda device: device.filter_alarm,
+    ),
+    SamsungBinarySensorEntityDescription(
+        key="connected",
+        name="Connected",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        is_on_fn=lambda device: device.connected,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Samsung binary sensor platform from config entry."""
+    coordinator: SamsungClimateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    def _add_device(device_id: str, multiple: bool) -> None:
+        """Add the binary sensors the payload of a new device has data for."""
+        device = coordinator.data[device_id]
+        async_add_entities(
+            SamsungBinarySensor(coordinator, config_entry, device_id, multiple, description)
+            for description in BINARY_SENSORS
+            if description.is_on_fn(device) is not None
+        )
+
+    async_track_devices(coordinator, config_entry, _add_device)
+
+
+class SamsungBinarySensor(SamsungDeviceEntity, BinarySensorEntity):
+    """Binary sensor reading a flag from the polled device state."""
+
+    entity_description: SamsungBinarySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SamsungClimateCoordinator,
+        config_entry: ConfigEntry,
+        device_id: str,
+        multiple: bool,
+        description: SamsungBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, config_entry, device_id, multiple, description.key)
+        self.entity_description = description
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the flag is set."""
+        return self.entity_description.is_on_fn(self.device)
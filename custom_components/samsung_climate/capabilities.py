@@ -0,0 +1,111 @@
+"""Persistent cache of the device capabilities for the Samsung Climate integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .model import Capabilities, capability_fingerprint
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.capabilities"
+STORAGE_VERSION = 1
+
+# Seconds to wait for more changes before writing the store
+SAVE_DELAY = 10
+
+
+def _key(entry_id: str, device_id: str) -> str:
+    """Return the store key of a device."""
+    return f"{entry_id}/{device_id}"
+
+
+class CapabilityStore:
+    """Capabilities of every device, kept across restarts.
+
+    The capabilities are read from a device payload once and stored with
+    the firmware fingerprint of that payload. Later payloads only have
+    their fingerprint compared, capabilities are read again when it changes
+    or after async_forget(). On startup the entities get the stored capabilities
+    before the first poll.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._fingerprints: dict[str, str] = {}
+        self._capabilities: dict[str, Capabilities] = {}
+        self.probes = 0
+
+    async def async_load(self) -> None:
+        """Load the stored capabilities."""
+        for key, stored in (await self._store.async_load() or {}).items():
+            try:
+                self._capabilities[key] = Capabilities.from_dict(stored["capabilities"])
+            except (KeyError, TypeError, AttributeError):
+                _LOGGER.debug("Ignoring invalid stored capabilities for %s", key)
+                continue
+            self._fingerprints[key] = stored.get("fingerprint", "")
+
+    def get(self, entry_id: str, device_id: str) -> Capabilities | None:
+        """Return the capabilities of a device, None if it was never probed."""
+        return self._capabilities.get(_key(entry_id, device_id))
+
+    @callback
+    def async_update(self, entry_id: str, device_id: str, device: dict[str, Any]) -> bool:
+        """Probe a full device payload if its firmware changed, return True if it did."""
+        key = _key(entry_id, device_id)
+        fingerprint = capability_fingerprint(device)
+        if self._fingerprints.get(key) == fingerprint and key in self._capabilities:
+            return False
+
+        capabilities = Capabilities.from_payload(device)
+        _LOGGER.debug("Probed capabilities of device %s: %s", key, capabilities)
+        self.probes += 1
+        self._fingerprints[key] = fingerprint
+        changed = self._capabilities.get(key) != capabilities
+        self._capabilities[key] = capabilities
+        self._async_schedule_save()
+        return changed
+
+    @callback
+    def async_forget(self, entry_id: str, device_id: str | None = None) -> None:
+        """Probe a device, or every device of an entry, again on the next poll."""
+        if device_id is not None:
+            self._fingerprints.pop(_key(entry_id, device_id), None)
+        else:
+            prefix = _key(entry_id, "")
+            for key in [key for key in self._fingerprints if key.startswith(prefix)]:
+                del self._fingerprints[key]
+        self._async_schedule_save()
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop the capabilities of the devices of a removed entry."""
+        prefix = _key(entry_id, "")
+        for key in [key for key in self._capabilities if key.startswith(prefix)]:
+            self._capabilities.pop(key)
+            self._fingerprints.pop(key, None)
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the store soon, merging nearby changes."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to store."""
+        return {
+            key: {
+                "fingerprint": self._fingerprints.get(key, ""),
+                "capabilities": capabilities.as_dict(),
+            }
+            for key, capabilities in self._capabilities.items()
+        }
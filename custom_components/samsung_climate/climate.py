@@ -1,19 +1,23 @@
 """Samsung climate platform for Home Assistant."""
 
-import ssl
 import logging
-import os
-import json
-import asyncio
+from operator import attrgetter
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
+    ATTR_SWING_MODE,
+    DEFAULT_MAX_TEMP,
+    DEFAULT_MIN_TEMP,
     HVACAction,
     HVACMode,
     FAN_AUTO,
     FAN_LOW,
     FAN_MEDIUM,
     FAN_HIGH,
+    SWING_BOTH,
+    SWING_HORIZONTAL,
     SWING_OFF,
     SWING_ON,
     ClimateEntityFeature
@@ -23,13 +27,17 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,    
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 
-from datetime import timedelta
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .coordinator import SamsungClimateCoordinator
 from .const import DOMAIN, CONF_CERT_PATH, DEFAULT_CERT_PATH
+from .entity import device_id_from_unique_id, device_info, device_name, device_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,6 +53,9 @@ AC_MODE_TO_HVAC = {
     "wind": HVACMode.FAN_ONLY,
 }
 
+# The AC reports modes with varying case (Cool, coolClean)
+_AC_MODE_TO_HVAC_LOWER = {mode.lower(): hvac_mode for mode, hvac_mode in AC_MODE_TO_HVAC.items()}
+
 HVAC_TO_AC_MODE = {
     HVACMode.HEAT_COOL: "auto",
     HVACMode.COOL: "cool",
@@ -70,13 +81,57 @@ AC_MODE_TO_FAN = {
 AC_MODE_TO_SWING = {
     "Fix": SWING_OFF,
     "Up_And_Low": SWING_ON,
+    "All": SWING_BOTH,
+    "Left_And_Right": SWING_HORIZONTAL,
 }
 
 SWING_TO_AC_MODE = {
     SWING_OFF: "Fix",
     SWING_ON: "Up_And_Low",
+    SWING_BOTH: "All",
+    SWING_HORIZONTAL: "Left_And_Right",
 }
 
+HVAC_MODES = [
+    HVACMode.HEAT_COOL,
+    HVACMode.COOL,
+    HVACMode.DRY,
+    HVACMode.HEAT,
+    HVACMode.FAN_ONLY,
+    HVACMode.OFF,
+]
+
+FAN_MODES = list(FAN_TO_AC_MODE)
+
+# Swing modes offered until the capabilities of the device are known
+DEFAULT_SWING_MODES = [SWING_OFF, SWING_ON]
+
+# The DeviceState fields the climate entity is derived from
+_CLIMATE_FIELDS = attrgetter(
+    "power_on",
+    "mode",
+    "current_temperature",
+    "target_temperature",
+    "temperature_unit",
+    "wind_direction",
+    "fan_speed",
+)
+
+
+def ac_mode(hvac_mode, capabilities=None):
+    """Return the AC mode to send for an HVAC mode, as the device names it."""
+    mode = HVAC_TO_AC_MODE[hvac_mode]
+    if capabilities is None or mode in (supported.lower() for supported in capabilities.modes):
+        return mode.capitalize()
+    return next(
+        (
+            supported
+            for supported in capabilities.modes
+            if _AC_MODE_TO_HVAC_LOWER.get(supported.lower()) == hvac_mode
+        ),
+        mode.capitalize(),
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -87,258 +142,198 @@ async def async_setup_entry(
     data = config_entry.data
     
     name = data.get("name", "Samsung AC")
-    host = data["host"]
-    port = data["port"]
-    token = data["token"]
-    cert_path = data.get("cert_path", "ac14k_m.pem")
-    
-    # If cert_path is relative, make it relative to this component directory
-    if not os.path.isabs(cert_path):
-        component_dir = os.path.dirname(os.path.abspath(__file__))
-        cert_path = os.path.join(component_dir, cert_path)
-
-    # Create a coordinator for polling
-    async def async_update_data():
-        """Fetch data from API (this is the polling function)."""
-        # _LOGGER.warning("Coordinator polling state for %s", name)
-        result = await _http_request(hass, host, port, token, cert_path)  # We'll define this helper below
-        if result and len(result.get('Devices', [])) > 0:
-            return result['Devices'][0]  # Return the device data
-        return None  # Or raise CoordinatorUpdateError if you want HA to handle retries
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_{config_entry.entry_id}",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=30),  # Poll every 30 seconds (adjust as needed; e.g., 5 for less frequent)
-    )
-
-    # Refresh once on setup to get initial state
-    await coordinator.async_config_entry_first_refresh()
-
-    entity = RoomAirConditioner(
-        coordinator=coordinator,  # Pass coordinator to entity
-        name=name,
-        host=host,
-        port=port,
-        token=token,
-        cert_path=cert_path,
-        unique_id=config_entry.entry_id
-    )
-    async_add_entities([entity], True)
-
-# Helper function to avoid duplicating _http_request logic (extracted from your class)
-async def _http_request(hass, host, port, token, cert_path, method="GET", path="", data=None):
-    """Shared HTTP request logic (extracted for coordinator use)."""
-    # (Copy your existing _http_request implementation here, but make it a standalone async function.
-    # Remove self-references; use passed params instead. For example:)
-    try:
-        def create_ssl_context():
-            sslcontext = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            sslcontext.set_ciphers('DEFAULT:@SECLEVEL=0')
-            sslcontext.check_hostname = False
-            sslcontext.verify_mode = ssl.CERT_NONE
-            sslcontext.minimum_version = ssl.TLSVersion.TLSv1
-            sslcontext.maximum_version = ssl.TLSVersion.TLSv1_3
-            sslcontext.options |= ssl.OP_LEGACY_SERVER_CONNECT
-            try:
-                sslcontext.load_cert_chain(cert_path)
-            except ssl.SSLError as ssl_ex:
-                _LOGGER.warning("SSL certificate load failed: %s", ssl_ex)
-            return sslcontext
-        
-        sslcontext = await hass.async_add_executor_job(create_ssl_context)
-        
-        reader, writer = await asyncio.open_connection(host, int(port), ssl=sslcontext)
-        
-        request = f"{method} /devices{path} HTTP/1.1\r\n"
-        request += f"Host: {host}:{port}\r\n"
-        request += f"Authorization: Bearer {token}\r\n"
-        
-        if method == "PUT" and data:
-            request += f"Content-Length: {len(data)}\r\n"
-            request += "Content-Type: application/json\r\n"
-        
-        request += "Connection: close\r\n"
-        request += "\r\n"
-        
-        if method == "PUT" and data:
-            request += data
-        
-        writer.write(request.encode())
-        await writer.drain()
-        
-        response_data = await reader.read()
-        writer.close()
-        await writer.wait_closed()
-        
-        response_text = response_data.decode('utf-8', errors='ignore')
-        
-        if "HTTP/1.1 200" in response_text or "HTTP/1.1 204" in response_text:
-            if method == "PUT":
-                return True
-            else:
-                json_start = response_text.find('\r\n\r\n')
-                if json_start != -1:
-                    json_data = response_text[json_start + 4:]
-                    if json_data.strip():
-                        return json.loads(json_data)
-        return None
-    
-    except Exception as ex:
-        _LOGGER.error("HTTP request failed: %s", ex)
-        return None
+    coordinator: SamsungClimateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    known_devices: set[str] = set()
+
+    @callback
+    def _async_add_devices(device_ids, multiple: bool) -> None:
+        """Create an entity for every device id not seen before."""
+        entities = []
+        for device_id in device_ids - known_devices:
+            known_devices.add(device_id)
+            entities.append(
+                RoomAirConditioner(
+                    coordinator=coordinator,
+                    device_id=device_id,
+                    name=device_name(name, device_id, multiple),
+                    unique_id=device_unique_id(config_entry.entry_id, device_id),
+                )
+            )
+        if entities:
+            async_add_entities(entities)
+
+    @callback
+    def _async_add_new_devices() -> None:
+        """Add the devices reported by the latest poll."""
+        if coordinator.data:
+            _async_add_devices(coordinator.data.keys(), len(coordinator.data) > 1)
+
+    # Devices registered in a previous run are added right away with their
+    # restored state, new ones once the first poll reports them
+    registered = {
+        device_id_from_unique_id(config_entry.entry_id, entity.unique_id)
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+        if entity.domain == "climate"
+    }
+    registered.discard(None)
+    _async_add_devices(registered, len(registered) > 1)
+    _async_add_new_devices()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
 
 
-class RoomAirConditioner(CoordinatorEntity, ClimateEntity):  # Inherit from CoordinatorEntity
+class RoomAirConditioner(CoordinatorEntity, RestoreEntity, ClimateEntity):  # Inherit from CoordinatorEntity
     """Representation of a room air conditioner device."""
     
-    def __init__(self, coordinator, name, host, port, token, cert_path, unique_id):  # Add coordinator param
+    def __init__(self, coordinator, device_id, name, unique_id):  # Add coordinator param
         """Initialize the device."""
         super().__init__(coordinator)  # Initialize coordinator
-        self._name = name
-        self._host = host
-        self._port = port
-        self._token = token
-        self._cert_path = cert_path
+        self._device_id = device_id
+        self._attr_name = name
         self._attr_unique_id = unique_id
-        
-        self._url = f'https://{host}:{port}/devices'
-        self._headers = { 
-            'Authorization': f'Bearer {token}'
-        }
+        self._attr_device_info = device_info(unique_id, name)
+        # Climate fields and capabilities of the last poll, used to skip
+        # redundant state writes
+        self._snapshot = None
+        self._was_available = None
+        # Set when the state was restored, to show it until the first poll
+        self._restored = False
         
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_current_temperature = None
         self._attr_target_temperature = None
+        self._attr_target_temperature_step = 1
         self._attr_hvac_mode = HVACMode.OFF
-        self._attr_hvac_modes = [
-            HVACMode.HEAT_COOL,
-            HVACMode.COOL,
-            HVACMode.DRY,
-            HVACMode.HEAT,
-            HVACMode.FAN_ONLY,
-            HVACMode.OFF
-        ]
-
-        self._attr_fan_modes = [
-            FAN_AUTO,
-            FAN_LOW,
-            FAN_MEDIUM,
-            FAN_HIGH
-        ]
-
-        self._attr_swing_modes = [
-            SWING_OFF,
-            SWING_ON,
-        ]
+        # Narrowed to the capabilities of the device on every update
+        self._attr_hvac_modes = list(HVAC_MODES)
+        self._attr_fan_modes = list(FAN_MODES)
+        self._attr_swing_modes = list(DEFAULT_SWING_MODES)
+        self._attr_fan_mode = None
+        self._attr_swing_mode = None
 
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.SWING_MODE
         self._attr_should_poll = False  # Disable automatic polling
 
     @property
-    def supported_features(self):
-        """Return the list of supported features."""
-        return self._attr_supported_features
-
-    @property
-    def temperature_unit(self):
-        """Return the unit of measurement."""
-        return self._attr_temperature_unit
-
-    @property
-    def name(self):
-        """Return the name of the climate device."""
-        return self._name
-
-    @property
-    def current_temperature(self):
-        """Return the current temperature."""
-        return self._attr_current_temperature
-
-    @property
-    def target_temperature(self):
-        """Return the temperature we try to reach."""
-        return self._attr_target_temperature
-
-    @property
-    def target_temperature_step(self):
-        """Return the supported step of target temperature."""
-        return 1
-
-    @property
-    def hvac_mode(self):
-        """Return current operation ie. heat, cool, idle."""
-        return self._attr_hvac_mode
-
-    @property
-    def hvac_modes(self):
-        """Return the list of available operation modes."""
-        return self._attr_hvac_modes
-
-    @property
-    def fan_mode(self):
-        """Return the fan setting."""
-        return self._attr_fan_mode
-
-    @property
-    def swing_mode(self):
-        """Return the swing setting."""
-        return self._attr_swing_mode
+    def available(self):
+        """Return True if the last poll succeeded and reported this device.
+
+        Before the first poll a restored entity is available with its last
+        known state.
+        """
+        if not super().available:
+            return False
+        if self.coordinator.data is None:
+            return self._restored
+        return self._device_id in self.coordinator.data
+
+    def _apply_capabilities(self, capabilities):
+        """Limit the modes and temperature range to what the device supports."""
+        hvac_modes = HVAC_MODES
+        fan_modes = FAN_MODES
+        swing_modes = DEFAULT_SWING_MODES
+        if capabilities is not None:
+            if capabilities.modes:
+                supported = {_AC_MODE_TO_HVAC_LOWER.get(mode.lower()) for mode in capabilities.modes}
+                hvac_modes = [
+                    mode for mode in HVAC_MODES if mode in supported or mode == HVACMode.OFF
+                ]
+            if capabilities.max_fan_level:
+                fan_modes = [
+                    mode
+                    for mode, level in FAN_TO_AC_MODE.items()
+                    if level <= capabilities.max_fan_level
+                ]
+            swing_modes = [
+                mode
+                for mode, direction in SWING_TO_AC_MODE.items()
+                if direction in capabilities.wind_directions
+            ] or DEFAULT_SWING_MODES
+        self._attr_hvac_modes = list(hvac_modes)
+        self._attr_fan_modes = list(fan_modes)
+        self._attr_swing_modes = list(swing_modes)
+        self._attr_min_temp = self._capability_temperature(
+            capabilities, "min_temperature", DEFAULT_MIN_TEMP
+        )
+        self._attr_max_temp = self._capability_temperature(
+            capabilities, "max_temperature", DEFAULT_MAX_TEMP
+        )
 
-    @property
-    def device_info(self):
-        """Return device info for registry (helps with deletion and device management)."""
-        return {
-            "identifiers": {(DOMAIN, self._attr_unique_id)},  # Ties to unique_id
-            "name": self._name,
-            "manufacturer": "Samsung",  # Or whatever fits
-            "model": "Room Air Conditioner",  # Customize as needed
-            "sw_version": "1.0",  # Optional
-        }
+    def _capability_temperature(self, capabilities, name, default):
+        """Return a temperature capability in the unit of the entity, default in Celsius."""
+        if capabilities is None or (value := getattr(capabilities, name)) is None:
+            value, unit = default, UnitOfTemperature.CELSIUS
+        elif capabilities.temperature_unit == 'Celsius':
+            unit = UnitOfTemperature.CELSIUS
+        else:
+            unit = UnitOfTemperature.FAHRENHEIT
+        return TemperatureConverter.convert(value, unit, self._attr_temperature_unit)
 
     async def async_added_to_hass(self):
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._restore_state(last_state)
         self._handle_coordinator_update()  # Initial update from coordinator data
 
+    def _restore_state(self, last_state):
+        """Show the state from before the restart until the first poll."""
+        try:
+            self._attr_hvac_mode = HVACMode(last_state.state)
+        except ValueError:
+            return  # Unavailable or unknown before the restart
+        attributes = last_state.attributes
+        # Restored temperatures are in the unit the state was written in
+        self._attr_temperature_unit = self.hass.config.units.temperature_unit
+        self._attr_current_temperature = attributes.get(ATTR_CURRENT_TEMPERATURE)
+        self._attr_target_temperature = attributes.get(ATTR_TEMPERATURE)
+        self._attr_fan_mode = attributes.get(ATTR_FAN_MODE)
+        self._attr_swing_mode = attributes.get(ATTR_SWING_MODE)
+        self._restored = True
+
     def _handle_coordinator_update(self):
         """Update entity from coordinator data (called on poll)."""
-        device = self.coordinator.data
-
-        if device:
-            if device["Operation"]["power"] == 'On':
-                self._attr_hvac_mode = AC_MODE_TO_HVAC.get(
-                    device["Mode"]["modes"][0].lower(), 
+        device = (self.coordinator.data or {}).get(self._device_id)
+        available = self.available
+
+        capabilities = self.coordinator.capabilities(self._device_id)
+        snapshot = (_CLIMATE_FIELDS(device) if device is not None else None, capabilities)
+        if snapshot == self._snapshot and available == self._was_available:
+            return  # Nothing changed since the last poll
+        self._snapshot = snapshot
+        self._was_available = available
+
+        if device is not None:
+            if device.power_on and device.mode is not None:
+                self._attr_hvac_mode = _AC_MODE_TO_HVAC_LOWER.get(
+                    device.mode.lower(),
                     HVACMode.OFF
                 )
             else:
                 self._attr_hvac_mode = HVACMode.OFF
 
-            if len(device.get("Temperatures", [])) > 0:
-                temp = device["Temperatures"][0]
-                self._attr_current_temperature = temp["current"]
-                self._attr_target_temperature = temp["desired"]
+            if device.temperature_unit is not None:
+                self._attr_current_temperature = device.current_temperature
+                self._attr_target_temperature = device.target_temperature
                 self._attr_temperature_unit = (
-                    UnitOfTemperature.CELSIUS 
-                    if temp["unit"] == 'Celsius' 
+                    UnitOfTemperature.CELSIUS
+                    if device.temperature_unit == 'Celsius'
                     else UnitOfTemperature.FAHRENHEIT
                 )
 
-            self._attr_swing_mode = AC_MODE_TO_SWING.get(device["Wind"]["direction"], SWING_OFF)
-            self._attr_fan_mode = AC_MODE_TO_FAN.get(device["Wind"]["speedLevel"], FAN_AUTO)
-            
+            self._attr_swing_mode = AC_MODE_TO_SWING.get(device.wind_direction, SWING_OFF)
+            self._attr_fan_mode = AC_MODE_TO_FAN.get(device.fan_speed, FAN_AUTO)
+
+        # After the unit, the temperature range is converted to it
+        self._apply_capabilities(capabilities)
         self.async_write_ha_state()  # Push to HA
 
     # Remove your existing async_update (coordinator handles polling now)
 
-    async def api_put_data(self, path, data):
-        """Send PUT request to the device API."""
-        return await _http_request(  # Use shared helper
-            self.hass, self._host, self._port, self._token, self._cert_path,
-            method="PUT", path=path, data=data
-        )
+    async def api_send_command(self, changes):
+        """Send changes to the device, merged with other pending commands."""
+        return await self.coordinator.async_send_command(self._device_id, changes)
     
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
@@ -348,20 +343,17 @@ class RoomAirConditioner(CoordinatorEntity, ClimateEntity):  # Inherit from Coor
         success = False
 
         fan_mode_ac = FAN_TO_AC_MODE[fan_mode]
-        success = await self.api_put_data(
-            '/0', 
-            f'{{"Wind" : {{"speedLevel": {fan_mode_ac} }}}}'
-        )
+        success = await self.api_send_command({"Wind": {"speedLevel": fan_mode_ac}})
 
         if success:
             self._attr_fan_mode = fan_mode
+            self._snapshot = None  # Let the next poll overwrite the optimistic state
             self.async_write_ha_state()
             
-            # Schedule a poll after delay to confirm (avoids race with stale API data)
-            await asyncio.sleep(5)  # Adjust delay based on your API's update time (e.g., 5-10 sec)
-            await self.coordinator.async_request_refresh()
+            # Confirm with a background poll
+            self.coordinator.async_schedule_confirmation_refresh()
         else:
-            _LOGGER.error("Failed to set FAN mode for %s", self._name)
+            _LOGGER.error("Failed to set FAN mode for %s", self.name)
 
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
@@ -372,41 +364,38 @@ class RoomAirConditioner(CoordinatorEntity, ClimateEntity):  # Inherit from Coor
         success = False
 
         swing_mode_ac = SWING_TO_AC_MODE[swing_mode]
-        success = await self.api_put_data(
-            '/0', 
-            f'{{"Wind" : {{"direction": "{swing_mode_ac}" }}}}'
-        )
+        success = await self.api_send_command({"Wind": {"direction": swing_mode_ac}})
 
         if success:
             self._attr_swing_mode = swing_mode
+            self._snapshot = None  # Let the next poll overwrite the optimistic state
             self.async_write_ha_state()
             
-            # Schedule a poll after delay to confirm (avoids race with stale API data)
-            await asyncio.sleep(5)  # Adjust delay based on your API's update time (e.g., 5-10 sec)
-            await self.coordinator.async_request_refresh()
+            # Confirm with a background poll
+            self.coordinator.async_schedule_confirmation_refresh()
         else:
-            _LOGGER.error("Failed to set SWING mode for %s", self._name)
+            _LOGGER.error("Failed to set SWING mode for %s", self.name)
     
 
-    # Update service methods to trigger coordinator refresh after a delay
+    # The setters write the new state optimistically, then a background poll
+    # confirms it while the command shadow masks polls that do not show it yet
     async def async_set_temperature(self, **kwargs):
         """Set new target temperatures."""
         if kwargs.get(ATTR_TEMPERATURE) is not None:
             target_temp = kwargs.get(ATTR_TEMPERATURE)
-            success = await self.api_put_data(
-                '/0/temperatures/0', 
-                f'{{"desired": {target_temp} }}'
+            success = await self.api_send_command(
+                {"Temperatures": [{"desired": target_temp}]}
             )
 
             if success:
                 self._attr_target_temperature = target_temp
+                self._snapshot = None  # Let the next poll overwrite the optimistic state
                 self.async_write_ha_state()  # Optimistic push
                 
-                # Schedule a poll after delay to confirm (avoids race with stale API data)
-                await asyncio.sleep(5)  # Adjust delay based on your API's update time (e.g., 5-10 sec)
-                await self.coordinator.async_request_refresh()
+                # Confirm with a background poll
+                self.coordinator.async_schedule_confirmation_refresh()
             else:
-                _LOGGER.error("Failed to set TEMPERATURE for %s", self._name)
+                _LOGGER.error("Failed to set TEMPERATURE for %s", self.name)
     
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new operation mode."""
@@ -416,26 +405,25 @@ class RoomAirConditioner(CoordinatorEntity, ClimateEntity):  # Inherit from Coor
         success = False
         
         if hvac_mode == HVACMode.OFF:
-            success = await self.api_put_data('/0', '{"Operation" : {"power" : "Off"} }')
+            success = await self.api_send_command({"Operation": {"power": "Off"}})
         else:
-            ac_mode = HVAC_TO_AC_MODE[hvac_mode]
-            success = await self.api_put_data(
-                '/0', 
-                f'{{"Operation" : {{"power" : "On"}}, "Mode" : {{"modes": ["{ac_mode.capitalize()}"] }}}}'
+            mode = ac_mode(hvac_mode, self.coordinator.capabilities(self._device_id))
+            success = await self.api_send_command(
+                {"Operation": {"power": "On"}, "Mode": {"modes": [mode]}}
             )
         
         if success:
             self._attr_hvac_mode = hvac_mode
+            self._snapshot = None  # Let the next poll overwrite the optimistic state
             self.async_write_ha_state()  # Optimistic push
             
-            # Schedule a poll after delay to confirm
-            await asyncio.sleep(5)  # Adjust as needed
-            await self.coordinator.async_request_refresh()
+            # Confirm with a background poll
+            self.coordinator.async_schedule_confirmation_refresh()
         else:
-            _LOGGER.error("Failed to set HVAC mode for %s", self._name)
+            _LOGGER.error("Failed to set HVAC mode for %s", self.name)
 
     async def async_will_remove_from_hass(self):
-        """Clean up when entity is removed (optional, but good for future-proofing)."""
+        """Clean up when entity is removed."""
         await super().async_will_remove_from_hass()
-        # Add any cleanup here, e.g., if you have listeners or connections to close
+        # The client is shared by the host's entities, the coordinator closes it on unload
         _LOGGER.debug(f"Entity {self.entity_id} is being removed")
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Command coalescing for the Samsung Climate integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def merge_changes(pending: dict[str, Any], changes: dict[str, Any]) -> None:
+    """Merge a command payload into the pending one, newer values win."""
+    for key, value in changes.items():
+        current = pending.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge_changes(current, value)
+        elif key == "Temperatures" and isinstance(current, list) and current:
+            merge_changes(current[0], value[0])
+        else:
+            pending[key] = value
+
+
+class CommandAggregator:
+    """Merge the commands sent to one device within a short window.
+
+    Every caller waits for the single PUT carrying the merged payload and
+    receives its result. A caller may pass a semaphore limiting how many
+    PUTs are in flight; the window is spent without holding it, only the
+    PUT waits for a slot.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_id: str,
+        send: Callable[[str, str], Awaitable[bool]],
+        window: float,
+    ) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._device_path = f"/{device_id}"
+        self._send = send
+        self.window = window
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[bool]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._limit: asyncio.Semaphore | None = None
+
+    async def async_send(
+        self, changes: dict[str, Any], limit: asyncio.Semaphore | None = None
+    ) -> bool:
+        """Queue changes for the device and wait for the merged PUT.
+
+        With limit, the PUT is sent once the semaphore has a free slot. The
+        first limit given within a window applies to the merged PUT.
+        """
+        merge_changes(self._pending, deepcopy(changes))
+        if self._limit is None:
+            self._limit = limit
+        waiter: asyncio.Future[bool] = self._hass.loop.create_future()
+        self._waiters.append(waiter)
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self.window, self._async_start_flush)
+        return await waiter
+
+    @callback
+    def _async_start_flush(self) -> None:
+        """Send the pending payload once the window has elapsed."""
+        self._timer = None
+        self._hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Send the merged payload and resolve every waiter."""
+        pending, self._pending = self._pending, {}
+        waiters, self._waiters = self._waiters, []
+        limit, self._limit = self._limit, None
+
+        if pending.keys() == {"Temperatures"}:
+            # Temperature only, use the dedicated resource
+            path = f"{self._device_path}/temperatures/0"
+            payload = pending["Temperatures"][0]
+        else:
+            path = self._device_path
+            payload = pending
+
+        if len(waiters) > 1:
+            _LOGGER.debug("Merged %s commands into one PUT to %s", len(waiters), path)
+
+        try:
+            if limit is None:
+                success = await self._send(path, json.dumps(payload))
+            else:
+                async with limit:
+                    success = await self._send(path, json.dumps(payload))
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error sending command to %s", path)
+            success = False
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(success)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop pending commands, failing their callers."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = {}
+        self._limit = None
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(False)
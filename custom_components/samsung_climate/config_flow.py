@@ -4,19 +4,34 @@ from __future__ import annotations
 import logging
 import voluptuous as vol
 import ipaddress
-import ssl
 import os
 import asyncio
 import json
 from typing import Any
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_CERT_PATH
+from .api import HttpProtocolError, SamsungClient
+from .const import (
+    DOMAIN,
+    CONF_CERT_PATH,
+    CONF_COMMAND_WINDOW,
+    CONF_LOCAL_PUSH,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_TRAFFIC,
+    DEFAULT_COMMAND_WINDOW,
+    DEFAULT_LOCAL_PUSH,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RECORD_TRAFFIC,
+)
+from .discovery import DiscoveredAC, async_discover
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +45,18 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Subnet offered for a scan when the local address cannot be determined
+DEFAULT_SCAN_SUBNET = "192.168.1.0/24"
+
+
+def resolve_cert_path(cert_path: str) -> str:
+    """Return the certificate path, relative paths are within this component."""
+    if not os.path.isabs(cert_path):
+        # Get the directory where this integration is located
+        component_dir = os.path.dirname(os.path.abspath(__file__))
+        cert_path = os.path.join(component_dir, cert_path)
+    return cert_path
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -43,88 +70,37 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         raise InvalidHost from ex
 
     # Get the certificate path - if relative, make it relative to this component
-    cert_path = data.get("cert_path", "ac14k_m.pem")
-    if not os.path.isabs(cert_path):
-        # Get the directory where this integration is located
-        component_dir = os.path.dirname(os.path.abspath(__file__))
-        cert_path = os.path.join(component_dir, cert_path)
-    
+    cert_path = resolve_cert_path(data.get("cert_path", "ac14k_m.pem"))
+
     # Check if certificate file exists
     if not os.path.exists(cert_path):
         raise CertificateNotFound
 
     # Test connection to the device
+    client = SamsungClient(data["host"], data["port"], data["token"], cert_path)
     try:
-        # Create SSL context in executor to avoid blocking
-        def create_ssl_context():
-            # Use SSLContext constructor directly to avoid set_default_verify_paths
-            sslcontext = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            # Allow weak certificates and signatures for older devices
-            sslcontext.set_ciphers('DEFAULT:@SECLEVEL=0')
-            sslcontext.check_hostname = False
-            sslcontext.verify_mode = ssl.CERT_NONE
-            
-            # Enable older TLS versions for compatibility with old devices
-            sslcontext.minimum_version = ssl.TLSVersion.TLSv1
-            sslcontext.maximum_version = ssl.TLSVersion.TLSv1_3
-            
-            # Set additional options for compatibility
-            sslcontext.options |= ssl.OP_LEGACY_SERVER_CONNECT
-            
-            try:
-                sslcontext.load_cert_chain(cert_path)
-            except ssl.SSLError as ssl_ex:
-                _LOGGER.warning("SSL certificate load failed: %s", ssl_ex)
-                # Continue without client certificate if loading fails
-                pass
-            return sslcontext
-        
-        # Run SSL context creation in executor
-        sslcontext = await hass.async_add_executor_job(create_ssl_context)
-        
-        # Use raw HTTP to avoid malformed header issues
-        reader, writer = await asyncio.open_connection(
-            data["host"], int(data["port"]), ssl=sslcontext
-        )
-        
-        # Construct manual HTTP request
-        request = f"GET /devices HTTP/1.1\r\n"
-        request += f"Host: {data['host']}:{data['port']}\r\n"
-        request += f"Authorization: Bearer {data['token']}\r\n"
-        request += "Connection: close\r\n"
-        request += "\r\n"
-        
-        writer.write(request.encode())
-        await writer.drain()
-        
-        # Read the response
-        response_data = await reader.read()
-        writer.close()
-        await writer.wait_closed()
-        
-        # Parse the response manually
-        response_text = response_data.decode('utf-8', errors='ignore')
-        
-        # Check if we got a 200 response
-        if "HTTP/1.1 200" not in response_text:
-            raise CannotConnect
-        
-        # Find the JSON part (after the headers)
-        json_start = response_text.find('\r\n\r\n')
-        if json_start != -1:
-            json_data = response_text[json_start + 4:]
-            if json_data.strip():
-                result = json.loads(json_data)
-                if not result.get('Devices'):
-                    raise NoDevices
-
+        response = await client.async_request()
     except FileNotFoundError as ex:
         raise CertificateNotFound from ex
-    except (ConnectionError, OSError, asyncio.TimeoutError) as ex:
+    except (ConnectionError, OSError, asyncio.TimeoutError, HttpProtocolError) as ex:
         raise CannotConnect from ex
     except Exception as ex:
         _LOGGER.exception("Unexpected exception")
         raise CannotConnect from ex
+    finally:
+        await client.async_close()
+
+    # Check if we got a 200 response
+    if response.status != 200:
+        raise CannotConnect
+
+    if response.body.strip():
+        try:
+            result = json.loads(response.body)
+        except ValueError as ex:
+            raise CannotConnect from ex
+        if not result.get('Devices'):
+            raise NoDevices
 
     # Store the full path for later use
     data["cert_path"] = cert_path
@@ -138,26 +114,98 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredAC] = {}
+        self._scan_input: dict[str, Any] = {}
+        self._suggested: dict[str, Any] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user scan the network or enter the address."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a subnet for ACs."""
         errors: dict[str, str] = {}
         if user_input is not None:
+            cert_path = resolve_cert_path(user_input["cert_path"])
             try:
-                info = await validate_input(self.hass, user_input)
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except InvalidHost:
-                errors["host"] = "invalid_host"
-            except NoDevices:
-                errors["base"] = "no_devices"
-            except CertificateNotFound:
+                discovered = await async_discover(
+                    user_input["subnet"], cert_path, user_input.get("token")
+                )
+            except ValueError:
+                errors["subnet"] = "invalid_subnet"
+            except FileNotFoundError:
                 errors["cert_path"] = "certificate_not_found"
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
             else:
+                configured = self._async_current_ids()
+                self._discovered = {
+                    result.host: result
+                    for result in discovered
+                    if f"{result.host}_{result.port}" not in configured
+                }
+                if self._discovered:
+                    self._scan_input = user_input
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("subnet", default=await self._async_default_subnet()): str,
+                    vol.Optional("token"): str,
+                    vol.Optional("cert_path", default="ac14k_m.pem"): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick one of the discovered ACs."""
+        if user_input is not None:
+            result = self._discovered[user_input["host"]]
+            self._suggested = {
+                "host": result.host,
+                "port": str(result.port),
+                "token": self._scan_input.get("token", ""),
+                "cert_path": self._scan_input["cert_path"],
+            }
+            return await self.async_step_manual()
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("host"): vol.In(
+                        {host: result.label for host, result in self._discovered.items()}
+                    ),
+                }
+            ),
+        )
+
+    async def _async_default_subnet(self) -> str:
+        """Return the /24 network Home Assistant is on."""
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+        except HomeAssistantError:
+            return DEFAULT_SCAN_SUBNET
+        return str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the connection details."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            info, errors = await self._async_validate(user_input)
+            if info is not None:
                 # Create unique ID based on host and port
                 unique_id = f"{user_input['host']}_{user_input['port']}"
                 await self.async_set_unique_id(unique_id)
@@ -166,7 +214,103 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA, self._suggested
+            ),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Add one AC of a bulk import, see the import_devices service."""
+        try:
+            data = STEP_USER_DATA_SCHEMA(dict(import_data))
+        except vol.Invalid:
+            return self.async_abort(reason="invalid_import")
+        # Skip configured ACs before connecting to them
+        await self.async_set_unique_id(f"{data['host']}_{data['port']}")
+        self._abort_if_unique_id_configured()
+
+        info, errors = await self._async_validate(data)
+        if info is None:
+            return self.async_abort(reason=next(iter(errors.values())))
+        return self.async_create_entry(title=info["title"], data=data)
+
+    async def _async_validate(
+        self, data: dict[str, Any]
+    ) -> tuple[dict[str, Any] | None, dict[str, str]]:
+        """Validate the connection details, return the entry info or the errors."""
+        errors: dict[str, str] = {}
+        try:
+            return await validate_input(self.hass, data), errors
+        except CannotConnect:
+            errors["base"] = "cannot_connect"
+        except InvalidHost:
+            errors["host"] = "invalid_host"
+        except NoDevices:
+            errors["base"] = "no_devices"
+        except CertificateNotFound:
+            errors["cert_path"] = "certificate_not_found"
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception")
+            errors["base"] = "unknown"
+        return None, errors
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Samsung Climate options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors[CONF_MAX_SCAN_INTERVAL] = "invalid_scan_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_COMMAND_WINDOW,
+                        default=options.get(CONF_COMMAND_WINDOW, DEFAULT_COMMAND_WINDOW),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Required(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_LOCAL_PUSH,
+                        default=options.get(CONF_LOCAL_PUSH, DEFAULT_LOCAL_PUSH),
+                    ): bool,
+                    vol.Required(
+                        CONF_RECORD_TRAFFIC,
+                        default=options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC),
+                    ): bool,
+                }
+            ),
+            errors=errors,
         )
 
 
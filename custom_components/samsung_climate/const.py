@@ -2,8 +2,27 @@
 from homeassistant.const import Platform
 
 DOMAIN = "samsung_climate"
-PLATFORMS = [Platform.CLIMATE]
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.SENSOR]
+
+# Key of the shared PollScheduler in hass.data[DOMAIN], next to the coordinators
+DATA_SCHEDULER = "scheduler"
+# Key of the shared PushListener, present while an entry uses local push
+DATA_PUSH = "push"
+# Key of the CapabilityStore, loaded once for all entries
+DATA_CAPABILITIES = "capabilities"
 
 # Configuration constants
 CONF_CERT_PATH = "cert_path"
 DEFAULT_CERT_PATH = "ac14k_m.pem"  # Default certificate filename within the component
+
+# Options
+CONF_COMMAND_WINDOW = "command_window"
+DEFAULT_COMMAND_WINDOW = 0.3  # Seconds to wait for more commands before sending a PUT
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 10  # Seconds, used right after a command or a change
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 300  # Seconds, upper bound for idle or unreachable units
+CONF_LOCAL_PUSH = "local_push"
+DEFAULT_LOCAL_PUSH = False  # Receive notifications from the AC on port 8889
+CONF_RECORD_TRAFFIC = "record_traffic"
+DEFAULT_RECORD_TRAFFIC = False  # Record the exchanges to <config>/samsung_climate/
@@ -0,0 +1,269 @@
+"""Data update coordinator for the Samsung Climate integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from operator import attrgetter
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import CONNECTION_ERRORS, CircuitOpenError, SamsungClient
+from .capabilities import CapabilityStore
+from .commands import CommandAggregator
+from .const import (
+    DEFAULT_COMMAND_WINDOW,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .model import Capabilities, DeviceState, decode_devices
+from .scheduler import PollScheduler
+from .shadow import CommandShadow
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+# Seconds to keep polling at the minimum interval after a command or a change
+FAST_POLL_DURATION = 60
+
+# Polling interval used as a consistency check when the AC pushes its state
+PUSH_UPDATE_INTERVAL = timedelta(minutes=5)
+
+# The DeviceState fields whose change starts fast polling, the sensor
+# readings drift on their own and do not
+_CONTROL_FIELDS = attrgetter(
+    "power_on", "mode", "target_temperature", "fan_speed", "wind_direction"
+)
+
+
+class SamsungClimateCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
+    """Poll every device behind one AC host with a single request.
+
+    The data is a mapping of device id to the DeviceState decoded from the
+    payload returned by GET /devices, the payload itself is not kept. The
+    polling interval adapts to the device: it is short right after a command
+    or a change, grows while every unit is off and stable, and backs off
+    exponentially while the host is unreachable. The shared PollScheduler
+    shifts each poll onto the entry's phase and limits how many ACs are
+    polled at once.
+
+    With local push enabled the AC's notifications update the data directly
+    and polling only runs every PUSH_UPDATE_INTERVAL as a fallback.
+
+    Values of commands the devices have not reported yet are kept in a
+    CommandShadow, which masks contradicting polled values, and polling
+    stays at the minimum interval until they are confirmed.
+
+    The capabilities of each device are read from the first poll, and again
+    only when its firmware changes, and persisted in the CapabilityStore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: SamsungClient,
+        entry_id: str,
+        scheduler: PollScheduler,
+        capability_store: CapabilityStore,
+        command_window: float = DEFAULT_COMMAND_WINDOW,
+        min_interval: float = DEFAULT_MIN_SCAN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry_id}",
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.client = client
+        self.entry_id = entry_id
+        self.scheduler = scheduler
+        self.capability_store = capability_store
+        self.command_window = command_window
+        self._aggregators: dict[str, CommandAggregator] = {}
+        self.shadow = CommandShadow()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._failures = 0
+        self._idle_interval = self._clamp(UPDATE_INTERVAL.total_seconds())
+        self._fast_poll_until = 0.0
+        self.push = False
+        self._set_interval(self._idle_interval)
+
+    def _clamp(self, seconds: float) -> float:
+        """Clamp an interval to the configured bounds."""
+        return max(self.min_interval, min(self.max_interval, seconds))
+
+    @property
+    def _base_interval(self) -> float:
+        """Return the regular polling interval."""
+        return (PUSH_UPDATE_INTERVAL if self.push else UPDATE_INTERVAL).total_seconds()
+
+    def _set_interval(self, seconds: float) -> None:
+        """Schedule the next poll about seconds from now, on the entry's phase."""
+        self.update_interval = timedelta(
+            seconds=self.scheduler.next_interval(
+                self.entry_id, seconds, self.min_interval, self.max_interval
+            )
+        )
+
+    async def _async_update_data(self) -> dict[str, DeviceState]:
+        """Fetch all devices and pick the interval until the next poll."""
+        try:
+            payloads = self.shadow.reconcile(await self._async_fetch_devices())
+        except UpdateFailed:
+            self._failures += 1
+            base = self._base_interval
+            self._set_interval(self._clamp(base * 2 ** min(self._failures - 1, 10)))
+            raise
+
+        self._failures = 0
+        for device_id, device in payloads.items():
+            self.capability_store.async_update(self.entry_id, device_id, device)
+        data = {
+            device_id: DeviceState.from_payload(device) for device_id, device in payloads.items()
+        }
+        base = self._base_interval
+        changed = self.data is not None and (
+            self._control_state(data) != self._control_state(self.data)
+        )
+        if changed:
+            self._fast_poll_until = time.monotonic() + FAST_POLL_DURATION
+            self._idle_interval = base
+        elif self.data is not None and all(
+            not device.power_on for device in data.values()
+        ):
+            # Every unit is off and nothing changed, poll less and less often
+            self._idle_interval = min(self._idle_interval * 2, self.max_interval)
+        else:
+            self._idle_interval = base
+
+        if self.shadow.pending or (time.monotonic() < self._fast_poll_until and not self.push):
+            interval = self.min_interval
+        else:
+            interval = self._clamp(self._idle_interval)
+        self._set_interval(interval)
+        return data
+
+    @staticmethod
+    def _control_state(data: dict[str, DeviceState]) -> dict[str, tuple[Any, ...]]:
+        """Return the settings of every device, without the sensor readings."""
+        return {device_id: _CONTROL_FIELDS(device) for device_id, device in data.items()}
+
+    async def _async_fetch_devices(self) -> dict[str, dict[str, Any]]:
+        """Fetch the payload of every device from the host."""
+        try:
+            async with self.scheduler.slots:
+                response = await self.client.async_request()
+            if not response.ok:
+                raise UpdateFailed(f"Unexpected status {response.status} from {self.client.host}")
+            return decode_devices(response.body)
+        except UpdateFailed:
+            raise
+        except Exception as ex:
+            raise UpdateFailed(f"HTTP request failed: {ex}") from ex
+
+    def capabilities(self, device_id: str) -> Capabilities | None:
+        """Return the capabilities of a device, None until it was probed."""
+        return self.capability_store.get(self.entry_id, device_id)
+
+    @callback
+    def async_handle_push(self, payload: Any) -> None:
+        """Apply a notification from the AC, or poll if it carries no state."""
+        devices = None
+        if isinstance(payload, dict):
+            if isinstance(payload.get("Devices"), list):
+                devices = payload["Devices"]
+            elif isinstance(payload.get("Device"), dict):
+                devices = [payload["Device"]]
+
+        payloads: dict[str, dict[str, Any]] | None = {}
+        for index, device in enumerate(devices or []):
+            device_id = str(device.get("id", index)) if isinstance(device, dict) else None
+            if self.data is None or device_id not in self.data:
+                payloads = None  # Only known devices can be updated from a partial state
+                break
+            payloads[device_id] = device
+
+        if devices and payloads is not None:
+            data = dict(self.data)
+            for device_id, device in self.shadow.reconcile(payloads).items():
+                data[device_id] = DeviceState.from_payload(device, data[device_id])
+            self.async_set_updated_data(data)
+        else:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_put(self, path: str, data: str) -> bool:
+        """Send a PUT request to /devices{path}, return True on success."""
+        try:
+            response = await self.client.async_request("PUT", path, data)
+        except (CircuitOpenError, *CONNECTION_ERRORS) as ex:
+            # The circuit breaker logs connection problems once per outage
+            _LOGGER.debug("Command to %s not sent: %s", path, ex)
+            return False
+        except Exception as ex:
+            _LOGGER.error("HTTP request failed: %s", ex)
+            return False
+        return response.ok
+
+    async def async_send_command(
+        self,
+        device_id: str,
+        changes: dict[str, Any],
+        limit: asyncio.Semaphore | None = None,
+    ) -> bool:
+        """Send changes to a device, merged with other commands in the window.
+
+        Until the device reports them, polls show the sent values. The PUT
+        waits for a slot of limit, if given, see CommandAggregator.
+        """
+        if (aggregator := self._aggregators.get(device_id)) is None:
+            aggregator = self._aggregators[device_id] = CommandAggregator(
+                self.hass, device_id, self.async_put, self.command_window
+            )
+        sequence = self.shadow.add(device_id, changes)
+        if not (success := await aggregator.async_send(changes, limit)):
+            self.shadow.discard(device_id, sequence)
+        return success
+
+    @callback
+    def async_apply_sent(self, sent: dict[str, dict[str, Any]]) -> None:
+        """Show commands delivered to devices right away, by device id.
+
+        The sent payloads are decoded on top of the current states, like a
+        notification, until a poll confirms them.
+        """
+        if self.data is None:
+            return
+        data = dict(self.data)
+        for device_id, changes in sent.items():
+            if device_id in data:
+                data[device_id] = DeviceState.from_payload(changes, data[device_id])
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_schedule_confirmation_refresh(self) -> None:
+        """Poll to confirm the latest command.
+
+        The shadow hides polls that do not show the command yet and keeps
+        polling fast until they do, so there is no need to wait for the
+        device first. Requests are debounced, so a burst of commands is
+        confirmed by few polls.
+        """
+        self._fast_poll_until = time.monotonic() + FAST_POLL_DURATION
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_close(self) -> None:
+        """Drop pending commands and close the connection."""
+        for aggregator in self._aggregators.values():
+            aggregator.async_cancel()
+        self.scheduler.unregister(self.entry_id)
+        await self.client.async_close()
+        if self.client.recorder is not None:
+            await self.client.recorder.async_close()
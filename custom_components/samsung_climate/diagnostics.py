@@ -0,0 +1,96 @@
+"""Diagnostics support for the Samsung Climate integration."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import SamsungClient
+from .const import DOMAIN
+from .coordinator import SamsungClimateCoordinator
+
+TO_REDACT = {"token", "uuid"}
+
+TIMING_PHASES = ("queue", "connect", "handshake", "ttfb", "transfer", "total")
+
+
+def _timing_summary(client: SamsungClient) -> dict[str, dict[str, float]]:
+    """Summarize the recent request phases in milliseconds."""
+    summary = {}
+    for phase in TIMING_PHASES:
+        values = sorted(getattr(timing, phase) * 1000 for timing in client.timings)
+        if not values:
+            continue
+        summary[phase] = {
+            "p50": round(values[len(values) // 2], 2),
+            "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 2),
+            "max": round(values[-1], 2),
+        }
+    return summary
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SamsungClimateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "push": coordinator.push,
+            "pending_commands": coordinator.shadow.pending,
+            "masked_values": coordinator.shadow.masked,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+        },
+        "client": {
+            "keep_alive": client.keep_alive,
+            "requests": client.requests,
+            "errors": client.errors,
+            "error_rate": client.error_rate,
+            "connections": client.connections,
+            "reconnects": client.reconnects,
+            "queued": client.queued,
+            "coalesced_polls": client.coalesced,
+            "tls_resumption": client.resumption,
+            "tls_session_hits": client.session_hits,
+            "tls_session_misses": client.session_misses,
+        },
+        "recording": (
+            {
+                "path": client.recorder.path,
+                "recorded": client.recorder.recorded,
+                "dropped": client.recorder.dropped,
+            }
+            if client.recorder is not None
+            else None
+        ),
+        "circuit": {
+            "state": client.circuit.state,
+            "failures": client.circuit.failures,
+            "cooldown": client.circuit.cooldown,
+            "rejected": client.circuit.rejected,
+        },
+        "timing_ms": _timing_summary(client),
+        "recent_requests": [asdict(timing) for timing in client.timings],
+        "devices": {
+            device_id: asdict(device) for device_id, device in (coordinator.data or {}).items()
+        },
+        "capabilities": {
+            device_id: capabilities.as_dict()
+            for device_id in coordinator.data or {}
+            if (capabilities := coordinator.capabilities(device_id)) is not None
+        },
+    }
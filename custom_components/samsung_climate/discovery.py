@@ -0,0 +1,129 @@
+"""LAN discovery of Samsung air conditioners."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import json
+import logging
+import ssl
+
+from .api import HttpProtocolError, async_get_ssl_context, async_read_response
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8888
+
+# Hosts probed at the same time
+SCAN_CONCURRENCY = 64
+
+# Seconds allowed to connect, and for the whole probe of one host
+CONNECT_TIMEOUT = 0.5
+PROBE_TIMEOUT = 2
+
+# Largest network accepted for a scan (a /22)
+MAX_SCAN_HOSTS = 1024
+
+
+@dataclass(slots=True)
+class DiscoveredAC:
+    """An AC answering the REST API on the scanned port."""
+
+    host: str
+    port: int
+    authorized: bool
+    devices: int = 0
+    model: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Return a description for the discovery results."""
+        if not self.authorized:
+            return f"{self.host} (token required)"
+        units = "1 unit" if self.devices == 1 else f"{self.devices} units"
+        return f"{self.host} - {self.model or 'Samsung AC'} ({units})"
+
+
+def scan_hosts(network: str) -> list[str]:
+    """Return the host addresses of a network like 192.168.1.0/24.
+
+    Raises ValueError for an invalid or too large network.
+    """
+    parsed = ipaddress.ip_network(network, strict=False)
+    if parsed.num_addresses > MAX_SCAN_HOSTS:
+        raise ValueError(f"{network} has more than {MAX_SCAN_HOSTS} addresses")
+    if parsed.num_addresses == 1:
+        return [str(parsed.network_address)]
+    return [str(host) for host in parsed.hosts()]
+
+
+async def async_probe(
+    host: str,
+    port: int,
+    sslcontext: ssl.SSLContext,
+    token: str | None = None,
+) -> DiscoveredAC | None:
+    """Fingerprint host through GET /devices, return None if it is not an AC."""
+    try:
+        async with asyncio.timeout(PROBE_TIMEOUT):
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                reader, writer = await asyncio.open_connection(host, port)
+            try:
+                await writer.start_tls(sslcontext)
+                request = f"GET /devices HTTP/1.1\r\nHost: {host}:{port}\r\n"
+                if token:
+                    request += f"Authorization: Bearer {token}\r\n"
+                request += "Connection: close\r\n\r\n"
+                writer.write(request.encode())
+                await writer.drain()
+                response = await async_read_response(reader)
+            finally:
+                writer.close()
+    except (OSError, TimeoutError, asyncio.IncompleteReadError, HttpProtocolError):
+        return None
+    except Exception as ex:  # pylint: disable=broad-except
+        # Anything may answer on the port, one odd host must not fail the scan
+        _LOGGER.debug("Unexpected response from %s:%s, skipped: %r", host, port, ex)
+        return None
+
+    if response.status in (401, 403):
+        return DiscoveredAC(host, port, authorized=False)
+    if not response.ok:
+        return None
+    try:
+        devices = json.loads(response.body).get("Devices")
+    except (ValueError, AttributeError):
+        return None
+    if not isinstance(devices, list):
+        return None
+
+    first = devices[0] if devices and isinstance(devices[0], dict) else {}
+    return DiscoveredAC(
+        host,
+        port,
+        authorized=True,
+        devices=len(devices),
+        model=first.get("description") or first.get("name"),
+    )
+
+
+async def async_discover(
+    network: str,
+    cert_path: str,
+    token: str | None = None,
+    port: int = DEFAULT_PORT,
+    concurrency: int = SCAN_CONCURRENCY,
+) -> list[DiscoveredAC]:
+    """Scan every host of network for ACs, sorted by address."""
+    hosts = scan_hosts(network)
+    sslcontext = await async_get_ssl_context(cert_path)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> DiscoveredAC | None:
+        async with semaphore:
+            return await async_probe(host, port, sslcontext, token)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    found = [result for result in results if result is not None]
+    _LOGGER.debug("Found %s ACs among %s hosts of %s", len(found), len(hosts), network)
+    return sorted(found, key=lambda result: ipaddress.ip_address(result.host))
@@ -0,0 +1,103 @@
+"""Shared helpers for the entities of the Samsung Climate integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import SamsungClimateCoordinator
+from .model import DeviceState
+
+
+def device_unique_id(entry_id: str, device_id: str) -> str:
+    """Return the unique id of the climate entity of a device.
+
+    The first device keeps the entry id so existing entities survive. The id
+    also identifies the device in the device registry.
+    """
+    return entry_id if device_id == "0" else f"{entry_id}_{device_id}"
+
+
+def device_id_from_unique_id(entry_id: str, unique_id: str) -> str | None:
+    """Return the device id a climate entity unique id was built from."""
+    if unique_id == entry_id:
+        return "0"
+    if unique_id.startswith(f"{entry_id}_"):
+        return unique_id[len(entry_id) + 1 :]
+    return None
+
+
+def device_name(name: str, device_id: str, multiple: bool) -> str:
+    """Return the name of a device, numbered when the host has several."""
+    return f"{name} {device_id}" if multiple and device_id != "0" else name
+
+
+def device_info(unique_id: str, name: str) -> DeviceInfo:
+    """Return the registry information of a device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, unique_id)},
+        name=name,
+        manufacturer="Samsung",
+        model="Room Air Conditioner",
+        sw_version="1.0",
+    )
+
+
+@callback
+def async_track_devices(
+    coordinator: SamsungClimateCoordinator,
+    config_entry: ConfigEntry,
+    add_device: Callable[[str, bool], None],
+) -> None:
+    """Call add_device(device_id, multiple) once for every polled device."""
+    known_devices: set[str] = set()
+
+    @callback
+    def _async_add_new_devices() -> None:
+        if not coordinator.data:
+            return
+        multiple = len(coordinator.data) > 1
+        for device_id in coordinator.data.keys() - known_devices:
+            known_devices.add(device_id)
+            add_device(device_id, multiple)
+
+    _async_add_new_devices()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
+
+
+class SamsungDeviceEntity(CoordinatorEntity[SamsungClimateCoordinator]):
+    """Entity reading one device of the coordinator data."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: SamsungClimateCoordinator,
+        config_entry: ConfigEntry,
+        device_id: str,
+        multiple: bool,
+        key: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id = device_id
+        unique_id = device_unique_id(config_entry.entry_id, device_id)
+        self._attr_unique_id = f"{unique_id}_{key}"
+        self._attr_device_info = device_info(
+            unique_id,
+            device_name(config_entry.data.get("name", "Samsung AC"), device_id, multiple),
+        )
+
+    @property
+    def device(self) -> DeviceState:
+        """Return the latest state of the device, empty if it is missing."""
+        return (self.coordinator.data or {}).get(self._device_id) or DeviceState()
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last poll succeeded and reported this device."""
+        return super().available and self._device_id in (self.coordinator.data or {})
@@ -0,0 +1,257 @@
+"""Device state model for the Samsung Climate integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+import json
+from typing import Any
+
+
+def _number(value: Any) -> float | None:
+    """Return value as a number, None if it is missing or not numeric."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value: Any) -> str | None:
+    """Return value if it is a string."""
+    return value if isinstance(value, str) else None
+
+
+def _field(section: Any, key: str) -> Any:
+    """Return a field of a payload section, None if the section is not an object."""
+    return section.get(key) if isinstance(section, dict) else None
+
+
+def _option(mode: Any, name: str) -> str | None:
+    """Return the value of a Mode option such as OutdoorTemp_63."""
+    prefix = f"{name}_"
+    options = _field(mode, "options")
+    return next(
+        (
+            option[len(prefix) :]
+            for option in (options if isinstance(options, list) else ())
+            if isinstance(option, str) and option.startswith(prefix)
+        ),
+        None,
+    )
+
+
+def _decode_operation(operation: Any) -> dict[str, Any]:
+    """Decode Operation.power."""
+    power = _text(_field(operation, "power"))
+    return {"power_on": power.lower() == "on" if power is not None else None}
+
+
+def _decode_mode(mode: Any) -> dict[str, Any]:
+    """Decode the current mode and the outdoor temperature option."""
+    modes = _field(mode, "modes")
+    return {
+        "mode": _text(modes[0]) if isinstance(modes, list) and modes else None,
+        "outdoor_temperature": _number(_option(mode, "OutdoorTemp")),
+    }
+
+
+def _decode_temperatures(temperatures: Any) -> dict[str, Any]:
+    """Decode the first entry of Temperatures."""
+    temperature = (
+        temperatures[0] if isinstance(temperatures, list) and temperatures else None
+    )
+    return {
+        "current_temperature": _number(_field(temperature, "current")),
+        "target_temperature": _number(_field(temperature, "desired")),
+        "temperature_unit": _text(_field(temperature, "unit")),
+    }
+
+
+def _decode_wind(wind: Any) -> dict[str, Any]:
+    """Decode the swing direction and fan speed."""
+    speed = _number(_field(wind, "speedLevel"))
+    return {
+        "wind_direction": _text(_field(wind, "direction")),
+        "fan_speed": int(speed) if speed is not None else None,
+    }
+
+
+def _decode_humidity(humidity: Any) -> dict[str, Any]:
+    """Decode Humidity.current."""
+    return {"humidity": _number(_field(humidity, "current"))}
+
+
+def _decode_energy(energy: Any) -> dict[str, Any]:
+    """Decode the power and energy meters."""
+    return {
+        "power_consumption": _number(_field(energy, "instantaneousPower")),
+        "energy": _number(_field(energy, "cumulatedConsumption")),
+    }
+
+
+def _decode_alarms(alarms: Any) -> dict[str, Any]:
+    """Decode whether the filter alarm is raised."""
+    if not isinstance(alarms, list):
+        return {"filter_alarm": None}
+    return {
+        "filter_alarm": any(
+            isinstance(alarm, dict) and alarm.get("code") == "FilterAlarm"
+            for alarm in alarms
+        )
+    }
+
+
+def _decode_connected(connected: Any) -> dict[str, Any]:
+    """Decode the connected flag."""
+    return {"connected": connected if isinstance(connected, bool) else None}
+
+
+# Payload sections and the decoder of the fields read from each
+_DECODERS: tuple[tuple[str, Callable[[Any], dict[str, Any]]], ...] = (
+    ("Operation", _decode_operation),
+    ("Mode", _decode_mode),
+    ("Temperatures", _decode_temperatures),
+    ("Wind", _decode_wind),
+    ("Humidity", _decode_humidity),
+    ("EnergyConsumption", _decode_energy),
+    ("Alarms", _decode_alarms),
+    ("connected", _decode_connected),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceState:
+    """The fields of a device payload the entities use.
+
+    Every field is None when the payload does not have it or it cannot be
+    decoded, so models omitting a section simply lack the matching values.
+    States are immutable and compare by value, so a change is detected with
+    a single comparison.
+    """
+
+    power_on: bool | None = None
+    mode: str | None = None
+    current_temperature: float | None = None
+    target_temperature: float | None = None
+    temperature_unit: str | None = None
+    wind_direction: str | None = None
+    fan_speed: int | None = None
+    outdoor_temperature: float | None = None
+    humidity: float | None = None
+    power_consumption: float | None = None
+    energy: float | None = None
+    filter_alarm: bool | None = None
+    connected: bool | None = None
+
+    @classmethod
+    def from_payload(
+        cls, device: Any, previous: DeviceState | None = None
+    ) -> DeviceState:
+        """Decode a device payload.
+
+        With previous, fields the payload does not provide keep their value
+        from previous, so the partial state of a notification can be
+        applied to a polled one.
+        """
+        values: dict[str, Any] = {}
+        if isinstance(device, dict):
+            for section, decode in _DECODERS:
+                if section in device:
+                    values.update(decode(device[section]))
+        if previous is None:
+            return cls(**values)
+        return replace(
+            previous, **{name: value for name, value in values.items() if value is not None}
+        )
+
+
+def _texts(values: Any) -> tuple[str, ...]:
+    """Return the strings of a list, in order."""
+    return tuple(value for value in values if isinstance(value, str)) if isinstance(values, list) else ()
+
+
+def capability_fingerprint(device: Any) -> str:
+    """Return what identifies the firmware of a device payload.
+
+    The model description and the list of resources change with a firmware
+    update, the current state does not.
+    """
+    if not isinstance(device, dict):
+        return ""
+    return json.dumps([device.get("description"), device.get("resources")], sort_keys=True)
+
+
+@dataclass(frozen=True, slots=True)
+class Capabilities:
+    """What a device supports, as its payload announces it.
+
+    Empty or None when the payload does not say, in which case the entities
+    fall back to their defaults.
+    """
+
+    modes: tuple[str, ...] = ()
+    max_fan_level: int | None = None
+    wind_directions: tuple[str, ...] = ()
+    min_temperature: float | None = None
+    max_temperature: float | None = None
+    temperature_unit: str | None = None
+
+    @classmethod
+    def from_payload(cls, device: Any) -> Capabilities:
+        """Read the capabilities from a full device payload."""
+        if not isinstance(device, dict):
+            return cls()
+        temperatures = device.get("Temperatures")
+        temperature = (
+            temperatures[0] if isinstance(temperatures, list) and temperatures else None
+        )
+        max_fan_level = _number(_field(device.get("Wind"), "maxSpeedLevel"))
+        return cls(
+            modes=_texts(_field(device.get("Mode"), "supportedModes")),
+            max_fan_level=int(max_fan_level) if max_fan_level is not None else None,
+            wind_directions=_texts(_field(device.get("Wind"), "supportedWindDirections")),
+            min_temperature=_number(_field(temperature, "minimum")),
+            max_temperature=_number(_field(temperature, "maximum")),
+            temperature_unit=_text(_field(temperature, "unit")),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Capabilities:
+        """Return capabilities stored with as_dict()."""
+        return cls(
+            modes=tuple(data.get("modes", ())),
+            max_fan_level=data.get("max_fan_level"),
+            wind_directions=tuple(data.get("wind_directions", ())),
+            min_temperature=data.get("min_temperature"),
+            max_temperature=data.get("max_temperature"),
+            temperature_unit=data.get("temperature_unit"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the capabilities as JSON serializable data."""
+        return {
+            "modes": list(self.modes),
+            "max_fan_level": self.max_fan_level,
+            "wind_directions": list(self.wind_directions),
+            "min_temperature": self.min_temperature,
+            "max_temperature": self.max_temperature,
+            "temperature_unit": self.temperature_unit,
+        }
+
+
+def decode_devices(body: bytes) -> dict[str, dict[str, Any]]:
+    """Return the device payloads of a GET /devices response by device id.
+
+    The payloads are only kept until they are decoded into DeviceState.
+    Raises ValueError if the body is not a JSON object.
+    """
+    result = json.loads(body)
+    if not isinstance(result, dict):
+        raise ValueError("Response is not a JSON object")
+    devices = result.get("Devices")
+    return {
+        str(device.get("id", index)): device
+        for index, device in enumerate(devices if isinstance(devices, list) else ())
+        if isinstance(device, dict)
+    }
@@ -0,0 +1,144 @@
+"""Local push notifications for the Samsung Climate integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from http import HTTPStatus
+import json
+import logging
+import ssl
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Port the AC sends its requests to, as for the device token
+PUSH_PORT = 8889
+
+# Largest notification accepted, headers included
+MAX_NOTIFICATION_SIZE = 64 * 1024
+
+HANDSHAKE_TIMEOUT = 5
+READ_TIMEOUT = 10
+
+NotificationCallback = Callable[[Any], None]
+
+
+def _create_server_ssl_context(cert_path: str) -> ssl.SSLContext:
+    """Create the server SSL context the AC connects to (blocking)."""
+    sslcontext = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    # Accept the weak ciphers and protocols of older firmware
+    sslcontext.set_ciphers("DEFAULT:@SECLEVEL=0")
+    sslcontext.minimum_version = ssl.TLSVersion.TLSv1
+    sslcontext.load_cert_chain(cert_path)
+    return sslcontext
+
+
+class PushListener:
+    """TLS listener for the notifications ACs send to port 8889.
+
+    One listener serves every config entry. A notification is routed by the
+    address of the sender to the callbacks registered for that host, with the
+    decoded JSON body, or None if the body is empty or not JSON.
+    """
+
+    def __init__(self, hass: HomeAssistant, port: int = PUSH_PORT) -> None:
+        """Initialize the listener."""
+        self._hass = hass
+        self._port = port
+        self._server: asyncio.Server | None = None
+        self._callbacks: dict[str, list[NotificationCallback]] = {}
+        self.notifications = 0
+
+    @property
+    def empty(self) -> bool:
+        """Return True if no callback is registered."""
+        return not self._callbacks
+
+    async def async_start(self, cert_path: str) -> None:
+        """Start listening, raise OSError if the port is not available."""
+        sslcontext = await self._hass.async_add_executor_job(
+            _create_server_ssl_context, cert_path
+        )
+        self._server = await asyncio.start_server(
+            self._async_handle_connection,
+            port=self._port,
+            ssl=sslcontext,
+            ssl_handshake_timeout=HANDSHAKE_TIMEOUT,
+        )
+        _LOGGER.debug("Listening for push notifications on port %s", self._port)
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    @callback
+    def async_register(self, host: str, notification_callback: NotificationCallback) -> None:
+        """Call notification_callback for every notification sent by host."""
+        self._callbacks.setdefault(host, []).append(notification_callback)
+
+    @callback
+    def async_unregister(self, notification_callback: NotificationCallback) -> None:
+        """Stop calling notification_callback."""
+        for host, callbacks in list(self._callbacks.items()):
+            if notification_callback in callbacks:
+                callbacks.remove(notification_callback)
+            if not callbacks:
+                del self._callbacks[host]
+
+    async def _async_handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read one notification and dispatch it."""
+        host = writer.get_extra_info("peername")[0]
+        try:
+            async with asyncio.timeout(READ_TIMEOUT):
+                status, body = await self._async_read_notification(reader)
+                callbacks = self._callbacks.get(host)
+                if status == 200 and not callbacks:
+                    status = 404
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    "Content-Length: 0\r\nConnection: close\r\n\r\n".encode()
+                )
+                await writer.drain()
+        except (OSError, TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as ex:
+            _LOGGER.debug("Failed to read notification from %s: %s", host, ex)
+            return
+        finally:
+            writer.close()
+
+        if status != 200:
+            _LOGGER.debug("Ignored notification from %s (status %s)", host, status)
+            return
+
+        try:
+            payload = json.loads(body) if body.strip() else None
+        except ValueError:
+            payload = None
+        self.notifications += 1
+        _LOGGER.debug("Notification from %s: %s", host, payload)
+        for notification_callback in list(callbacks):
+            notification_callback(payload)
+
+    async def _async_read_notification(self, reader: asyncio.StreamReader) -> tuple[int, bytes]:
+        """Read a request, return the response status and the body."""
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        if request_line.split(" ", 1)[0] not in ("POST", "PUT"):
+            return 405, b""
+        length = 0
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                try:
+                    length = int(value)
+                except ValueError:
+                    return 400, b""
+        if length < 0 or len(head) + length > MAX_NOTIFICATION_SIZE:
+            return 413, b""
+        return 200, await reader.readexactly(length)
@@ -0,0 +1,121 @@
+"""Recording of the exchanges with the Samsung air conditioner."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Size (bytes) of a recording file before it is rotated, and rotated files kept
+RECORD_MAX_BYTES = 5 * 1024 * 1024
+RECORD_BACKUPS = 2
+
+# Exchanges waiting to be written before new ones are dropped
+RECORD_QUEUE_SIZE = 1000
+
+REDACTED = "**REDACTED**"
+
+_STOP = object()
+
+
+class TrafficRecorder:
+    """Append exchanges to an NDJSON file without blocking the event loop.
+
+    Each record is serialized on the caller's thread, with every secret
+    replaced by REDACTED, and written by a dedicated thread. The queue is
+    bounded: records arriving while it is full are dropped and counted
+    instead of slowing the client down. The file is rotated like a log file
+    (path.1, path.2, ...) once it reaches ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        redact: Iterable[str] = (),
+        max_bytes: int = RECORD_MAX_BYTES,
+        backups: int = RECORD_BACKUPS,
+        max_queue: int = RECORD_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._redact = [secret for secret in redact if secret]
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._queue: queue.Queue[Any] = queue.Queue(max_queue)
+        self._thread: threading.Thread | None = None
+        self.recorded = 0
+        self.dropped = 0
+
+    def record(self, exchange: dict[str, Any]) -> None:
+        """Queue one exchange for writing."""
+        line = json.dumps(exchange, separators=(",", ":"), default=str)
+        for secret in self._redact:
+            line = line.replace(secret, REDACTED)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"recorder {os.path.basename(self.path)}", daemon=True
+            )
+            self._thread.start()
+        try:
+            self._queue.put_nowait(line + "\n")
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Write the queued exchanges and stop the writer thread (blocking)."""
+        if (thread := self._thread) is None:
+            return
+        self._thread = None
+        self._queue.put(_STOP)
+        thread.join()
+
+    async def async_close(self) -> None:
+        """Write the queued exchanges and stop the writer thread."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def _run(self) -> None:
+        """Write queued lines until close() is called."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        except OSError as ex:
+            _LOGGER.error("Cannot record traffic to %s: %s", self.path, ex)
+            file = None
+
+        size = file.tell() if file is not None else 0
+        while (line := self._queue.get()) is not _STOP:
+            if file is None:
+                continue  # Keep draining so record() never blocks
+            try:
+                if size and size + len(line) > self._max_bytes:
+                    file.close()
+                    self._rotate()
+                    file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+                    size = 0
+                file.write(line)
+                size += len(line)
+                if self._queue.empty():
+                    file.flush()
+            except OSError as ex:
+                _LOGGER.error("Stopped recording traffic to %s: %s", self.path, ex)
+                file.close()
+                file = None
+        if file is not None:
+            file.close()
+
+    def _rotate(self) -> None:
+        """Shift path to path.1, path.1 to path.2 and so on (blocking)."""
+        for index in range(self._backups, 0, -1):
+            source = f"{self.path}.{index - 1}" if index > 1 else self.path
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index}")
+        if not self._backups:
+            os.remove(self.path)
@@ -0,0 +1,81 @@
+"""Fleet-wide poll scheduling for the Samsung Climate integration."""
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+
+# Polls allowed to run at the same time across every AC
+MAX_CONCURRENT_POLLS = 4
+
+# Random offset added to every poll, as a share of the interval and at most
+POLL_JITTER = 0.05
+MAX_POLL_JITTER = 2
+
+# Delay (seconds) between the first polls of entries set up together
+STARTUP_STAGGER = 0.2
+# Upper bound of that delay, so large installations still start promptly
+MAX_STARTUP_DELAY = 10
+
+
+class PollScheduler:
+    """Spread the polls of every AC and cap how many run at once.
+
+    Each registered config entry gets an evenly spaced phase. The interval a
+    coordinator picks is stretched or shortened (by at most half of it) so
+    the poll lands on the entry's phase, plus a little jitter, which keeps
+    entries with the same interval from polling at the same moment. The
+    result is clamped to the coordinator's minimum and maximum interval, so
+    the configured bounds always win over the phase. At most
+    ``max_concurrent`` polls hold a slot at a time.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize the scheduler."""
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self._entries: list[str] = []
+        self._phases: dict[str, float] = {}
+        self._epoch = time.monotonic()
+
+    @property
+    def empty(self) -> bool:
+        """Return True if no entry is registered."""
+        return not self._entries
+
+    def register(self, entry_id: str) -> float:
+        """Register an entry, return the delay before its first poll."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+            self._rebalance()
+        return min(self._entries.index(entry_id) * STARTUP_STAGGER, MAX_STARTUP_DELAY)
+
+    def unregister(self, entry_id: str) -> None:
+        """Forget an entry and spread the remaining ones again."""
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Give every entry an evenly spaced phase."""
+        count = len(self._entries)
+        self._phases = {entry_id: index / count for index, entry_id in enumerate(self._entries)}
+
+    def next_interval(
+        self,
+        entry_id: str,
+        interval: float,
+        minimum: float = 1.0,
+        maximum: float = math.inf,
+    ) -> float:
+        """Return the delay until the next poll of an entry polled every interval.
+
+        The delay is kept within minimum and maximum.
+        """
+        now = time.monotonic() - self._epoch
+        phase = self._phases.get(entry_id, 0.0) * interval
+        earliest = now + interval / 2
+        # First point of the entry's grid (phase + k * interval) after earliest
+        delay = earliest + (phase - earliest) % interval - now
+        jitter = min(interval * POLL_JITTER, MAX_POLL_JITTER)
+        return max(minimum, min(maximum, delay + random.uniform(-jitter, jitter)))
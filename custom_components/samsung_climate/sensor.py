@@ -0,0 +1,198 @@
+"""Sensor platform for the Samsung Climate integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import SamsungClient
+from .const import DOMAIN
+from .coordinator import SamsungClimateCoordinator
+from .entity import SamsungDeviceEntity, async_track_devices, device_info
+from .model import DeviceState
+
+
+def _last_poll_latency(client: SamsungClient) -> StateType:
+    """Return the duration of the latest poll in milliseconds."""
+    if (timing := client.last_timing("GET")) is None:
+        return None
+    return round(timing.total * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SamsungClientSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor derived from the client statistics."""
+
+    value_fn: Callable[[SamsungClient], StateType]
+
+
+CLIENT_SENSORS: tuple[SamsungClientSensorEntityDescription, ...] = (
+    SamsungClientSensorEntityDescription(
+        key="last_poll_latency",
+        name="Last poll latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_last_poll_latency,
+    ),
+    SamsungClientSensorEntityDescription(
+        key="error_rate",
+        name="Error rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client: round(client.error_rate * 100, 1),
+    ),
+    SamsungClientSensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client: client.reconnects,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SamsungDeviceSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor read from the device state.
+
+    The sensor is only created for devices whose payload has a value.
+    """
+
+    value_fn: Callable[[DeviceState], float | None]
+
+
+DEVICE_SENSORS: tuple[SamsungDeviceSensorEntityDescription, ...] = (
+    SamsungDeviceSensorEntityDescription(
+        key="outdoor_temperature",
+        name="Outdoor temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        # The firmware reports the outdoor unit temperature in Fahrenheit
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: device.outdoor_temperature,
+    ),
+    SamsungDeviceSensorEntityDescription(
+        key="humidity",
+        name="Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: device.humidity,
+    ),
+    SamsungDeviceSensorEntityDescription(
+        key="power",
+        name="Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: device.power_consumption,
+    ),
+    SamsungDeviceSensorEntityDescription(
+        key="energy",
+        name="Energy",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.energy,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Samsung sensor platform from config entry."""
+    coordinator: SamsungClimateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities(
+        SamsungClientSensor(coordinator, config_entry, description)
+        for description in CLIENT_SENSORS
+    )
+
+    def _add_device(device_id: str, multiple: bool) -> None:
+        """Add the sensors the payload of a new device has values for."""
+        device = coordinator.data[device_id]
+        async_add_entities(
+            SamsungDeviceSensor(coordinator, config_entry, device_id, multiple, description)
+            for description in DEVICE_SENSORS
+            if description.value_fn(device) is not None
+        )
+
+    async_track_devices(coordinator, config_entry, _add_device)
+
+
+class SamsungClientSensor(CoordinatorEntity[SamsungClimateCoordinator], SensorEntity):
+    """Diagnostic sensor reporting how the AC host responds."""
+
+    entity_description: SamsungClientSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: SamsungClimateCoordinator,
+        config_entry: ConfigEntry,
+        description: SamsungClientSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        # Same device as the climate entity of the first device on the host
+        self._attr_device_info = device_info(
+            config_entry.entry_id, config_entry.data.get("name", "Samsung AC")
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the host is unreachable, that is when it matters."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.client)
+
+
+class SamsungDeviceSensor(SamsungDeviceEntity, SensorEntity):
+    """Sensor reading a value from the polled device state."""
+
+    entity_description: SamsungDeviceSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SamsungClimateCoordinator,
+        config_entry: ConfigEntry,
+        device_id: str,
+        multiple: bool,
+        description: SamsungDeviceSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, config_entry, device_id, multiple, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.device)
@@ -0,0 +1,289 @@
+"""Services for the Samsung Climate integration."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate import (
+    ATTR_FAN_MODE,
+    ATTR_HVAC_MODE,
+    ATTR_SWING_MODE,
+    HVACMode,
+)
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .climate import FAN_TO_AC_MODE, HVAC_TO_AC_MODE, SWING_TO_AC_MODE, ac_mode
+from .const import CONF_CERT_PATH, DEFAULT_CERT_PATH, DOMAIN
+from .coordinator import SamsungClimateCoordinator
+from .entity import device_id_from_unique_id
+from .model import Capabilities
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY = "apply"
+SERVICE_REFRESH_CAPABILITIES = "refresh_capabilities"
+SERVICE_IMPORT_DEVICES = "import_devices"
+
+ATTR_DEVICES = "devices"
+ATTR_CSV = "csv"
+
+# PUTs in flight at once for one apply call, the command window is not limited
+MAX_CONCURRENT_COMMANDS = 16
+
+# ACs validated at once by one import_devices call
+MAX_CONCURRENT_IMPORTS = 16
+
+APPLY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(ATTR_HVAC_MODE): vol.All(
+                vol.Coerce(HVACMode), vol.In([*HVAC_TO_AC_MODE, HVACMode.OFF])
+            ),
+            vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+            vol.Optional(ATTR_FAN_MODE): vol.In(FAN_TO_AC_MODE),
+            vol.Optional(ATTR_SWING_MODE): vol.In(SWING_TO_AC_MODE),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_HVAC_MODE, ATTR_TEMPERATURE, ATTR_FAN_MODE, ATTR_SWING_MODE),
+)
+
+
+REFRESH_CAPABILITIES_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_ids})
+
+IMPORT_ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required("host"): vol.All(cv.string, str.strip, cv.matches_regex(".+")),
+        vol.Optional("port", default="8888"): vol.All(cv.string, str.strip),
+        vol.Required("token"): vol.All(cv.string, str.strip, cv.matches_regex(".+")),
+        vol.Optional("name"): vol.All(cv.string, str.strip),
+        vol.Optional(CONF_CERT_PATH): vol.All(cv.string, str.strip),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+IMPORT_DEVICES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICES): vol.All(cv.ensure_list, [dict]),
+            vol.Optional(ATTR_CSV): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_DEVICES, ATTR_CSV),
+)
+
+
+@callback
+def _async_get_device(
+    hass: HomeAssistant, registry: er.EntityRegistry, entity_id: str
+) -> tuple[SamsungClimateCoordinator, str]:
+    """Return the coordinator and device id of a climate entity.
+
+    Raises ValueError with the reason if the entity is not a loaded Samsung
+    Climate entity.
+    """
+    entry = registry.async_get(entity_id)
+    if entry is None or entry.platform != DOMAIN or entry.domain != Platform.CLIMATE:
+        raise ValueError("not a Samsung Climate entity")
+    coordinator: SamsungClimateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.config_entry_id
+    )
+    device_id = device_id_from_unique_id(entry.config_entry_id, entry.unique_id)
+    if coordinator is None or device_id is None:
+        raise ValueError("config entry not loaded")
+    return coordinator, device_id
+
+
+def parse_import_rows(data: dict[str, Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return the valid rows of an import_devices call and the invalid ones.
+
+    Rows come from the devices list and from the CSV text, whose first line
+    names the columns (host, port, token, name, cert_path). Empty cells take
+    the default, a row repeating the host and port of an earlier one is
+    invalid.
+    """
+    rows: list[dict[str, Any]] = list(data.get(ATTR_DEVICES, []))
+    if text := data.get(ATTR_CSV):
+        reader = csv.DictReader(io.StringIO(text.strip()), skipinitialspace=True)
+        rows.extend(
+            {key.strip().lower(): value for key, value in row.items() if key and value}
+            for row in reader
+        )
+
+    valid: list[dict[str, Any]] = []
+    invalid: list[dict[str, Any]] = []
+    seen: set[tuple[str, str]] = set()
+    for row in rows:
+        try:
+            row = IMPORT_ROW_SCHEMA(row)
+        except vol.Invalid as ex:
+            invalid.append(
+                {"host": row.get("host"), "port": row.get("port"), "reason": str(ex)}
+            )
+            continue
+        if (row["host"], row["port"]) in seen:
+            invalid.append({"host": row["host"], "port": row["port"], "reason": "duplicate"})
+            continue
+        seen.add((row["host"], row["port"]))
+        row["name"] = row.get("name") or f"Samsung AC {row['host']}"
+        row[CONF_CERT_PATH] = row.get(CONF_CERT_PATH) or DEFAULT_CERT_PATH
+        valid.append(row)
+    return valid, invalid
+
+
+def build_changes(
+    settings: dict[str, Any], capabilities: Capabilities | None = None
+) -> dict[str, Any]:
+    """Return the command payload for the settings of an apply call.
+
+    The mode is spelled the way the capabilities of the device name it.
+    """
+    changes: dict[str, Any] = {}
+    if (hvac_mode := settings.get(ATTR_HVAC_MODE)) == HVACMode.OFF:
+        changes["Operation"] = {"power": "Off"}
+    elif hvac_mode is not None:
+        changes["Operation"] = {"power": "On"}
+        changes["Mode"] = {"modes": [ac_mode(hvac_mode, capabilities)]}
+    if (temperature := settings.get(ATTR_TEMPERATURE)) is not None:
+        changes["Temperatures"] = [{"desired": temperature}]
+    wind = {}
+    if (fan_mode := settings.get(ATTR_FAN_MODE)) is not None:
+        wind["speedLevel"] = FAN_TO_AC_MODE[fan_mode]
+    if (swing_mode := settings.get(ATTR_SWING_MODE)) is not None:
+        wind["direction"] = SWING_TO_AC_MODE[swing_mode]
+    if wind:
+        changes["Wind"] = wind
+    return changes
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_apply(call: ServiceCall) -> ServiceResponse:
+        """Send the same settings to many ACs at once."""
+        registry = er.async_get(hass)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+        sent: dict[SamsungClimateCoordinator, dict[str, dict[str, Any]]] = {}
+
+        async def apply(entity_id: str) -> dict[str, Any]:
+            try:
+                coordinator, device_id = _async_get_device(hass, registry, entity_id)
+            except ValueError as ex:
+                return {"success": False, "error": str(ex)}
+
+            changes = build_changes(call.data, coordinator.capabilities(device_id))
+            start = time.perf_counter()
+            success = await coordinator.async_send_command(device_id, changes, semaphore)
+            latency = time.perf_counter() - start
+            if success:
+                sent.setdefault(coordinator, {})[device_id] = changes
+            return {"success": success, "latency_ms": round(latency * 1000, 1)}
+
+        entity_ids = call.data[ATTR_ENTITY_ID]
+        results = await asyncio.gather(*(apply(entity_id) for entity_id in entity_ids))
+        for coordinator, changes in sent.items():
+            # Update the entities now, like the climate setters, a poll confirms later
+            coordinator.async_apply_sent(changes)
+            coordinator.async_schedule_confirmation_refresh()
+
+        succeeded = sum(result["success"] for result in results)
+        return {
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": dict(zip(entity_ids, results)),
+        }
+
+    async def async_refresh_capabilities(call: ServiceCall) -> None:
+        """Probe the capabilities of the devices again on the next poll."""
+        registry = er.async_get(hass)
+        refresh: set[SamsungClimateCoordinator] = set()
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            try:
+                coordinator, device_id = _async_get_device(hass, registry, entity_id)
+            except ValueError as ex:
+                raise ServiceValidationError(f"{entity_id}: {ex}") from ex
+            coordinator.capability_store.async_forget(coordinator.entry_id, device_id)
+            refresh.add(coordinator)
+        for coordinator in refresh:
+            await coordinator.async_request_refresh()
+
+    async def async_import_devices(call: ServiceCall) -> ServiceResponse:
+        """Validate many ACs at once and add the reachable ones."""
+        rows, failed = parse_import_rows(call.data)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMPORTS)
+        created: list[dict[str, Any]] = []
+
+        async def import_row(row: dict[str, Any]) -> None:
+            # Every row of a certificate shares one SSL context, see async_get_ssl_context
+            async with semaphore:
+                result = await hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=row
+                )
+            if result["type"] == "create_entry":
+                created.append(
+                    {
+                        "host": row["host"],
+                        "port": row["port"],
+                        "title": result["title"],
+                        "entry_id": result["result"].entry_id,
+                    }
+                )
+            else:
+                failed.append(
+                    {"host": row["host"], "port": row["port"], "reason": result["reason"]}
+                )
+
+        await asyncio.gather(*(import_row(row) for row in rows))
+        if failed:
+            _LOGGER.warning(
+                "Imported %s of %s Samsung ACs, failed: %s",
+                len(created),
+                len(created) + len(failed),
+                ", ".join(
+                    f"{row['host']}:{row['port']} ({row['reason']})" for row in failed
+                ),
+            )
+        return {
+            "succeeded": len(created),
+            "failed": len(failed),
+            "created": created,
+            "errors": failed,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY,
+        async_apply,
+        schema=APPLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_CAPABILITIES,
+        async_refresh_capabilities,
+        schema=REFRESH_CAPABILITIES_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_DEVICES,
+        async_import_devices,
+        schema=IMPORT_DEVICES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,148 @@
+"""Pending command tracking for the Samsung Climate integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import itertools
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a command may stay unconfirmed before polled values win again
+SHADOW_TIMEOUT = 30
+
+_MISSING = object()
+
+Path = tuple[str | int, ...]
+
+
+@dataclass(slots=True)
+class _PendingValue:
+    """A value sent to a device and not reported back yet."""
+
+    value: Any
+    sequence: int
+    expires: float
+
+
+def _flatten(changes: dict[str, Any], prefix: Path = ()) -> dict[Path, Any]:
+    """Return the leaf values of a command payload by path.
+
+    Lists of objects such as Temperatures are indexed, other lists are
+    values of their own (Mode.modes).
+    """
+    leaves: dict[Path, Any] = {}
+    for key, value in changes.items():
+        path = (*prefix, key)
+        if isinstance(value, dict):
+            leaves.update(_flatten(value, path))
+        elif isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            for index, item in enumerate(value):
+                leaves.update(_flatten(item, (*path, index)))
+        else:
+            leaves[path] = value
+    return leaves
+
+
+def _get(device: Any, path: Path) -> Any:
+    """Return the value at path, _MISSING if the payload does not have it."""
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(device, list) or key >= len(device):
+                return _MISSING
+            device = device[key]
+        elif isinstance(device, dict) and key in device:
+            device = device[key]
+        else:
+            return _MISSING
+    return device
+
+
+def _set(device: Any, path: Path, value: Any) -> None:
+    """Replace the value at an existing path."""
+    for key in path[:-1]:
+        device = device[key]
+    device[path[-1]] = value
+
+
+def _normalize(value: Any) -> Any:
+    """Return value in a form where "Heat" matches "heat" and 22 matches 22.0."""
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+class CommandShadow:
+    """Values sent to the devices that the device has not reported yet.
+
+    A polled value that contradicts a pending one is replaced by the pending
+    value, so a poll that started before the command, or firmware that applies
+    it late, does not flip the state back. A pending value is dropped once a
+    poll reports it, when it expires, or when its command failed. Every
+    command gets a sequence number so a failure only clears the fields a newer
+    command has not overwritten.
+    """
+
+    def __init__(self, timeout: float = SHADOW_TIMEOUT) -> None:
+        """Initialize the shadow."""
+        self._timeout = timeout
+        self._pending: dict[str, dict[Path, _PendingValue]] = {}
+        self._sequence = itertools.count(1)
+        self.masked = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return True if a command is waiting for confirmation."""
+        return bool(self._pending)
+
+    def add(self, device_id: str, changes: dict[str, Any]) -> int:
+        """Record a command sent to a device, return its sequence number."""
+        sequence = next(self._sequence)
+        expires = time.monotonic() + self._timeout
+        fields = self._pending.setdefault(device_id, {})
+        for path, value in _flatten(changes).items():
+            fields[path] = _PendingValue(value, sequence, expires)
+        return sequence
+
+    def discard(self, device_id: str, sequence: int) -> None:
+        """Forget the values of a command that was not delivered."""
+        fields = self._pending.get(device_id, {})
+        for path, pending in list(fields.items()):
+            if pending.sequence == sequence:
+                del fields[path]
+        if not fields:
+            self._pending.pop(device_id, None)
+
+    def reconcile(self, data: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Mask the polled values contradicting pending ones, in place."""
+        now = time.monotonic()
+        for device_id, fields in list(self._pending.items()):
+            device = data.get(device_id)
+            for path, pending in list(fields.items()):
+                if pending.expires <= now:
+                    _LOGGER.debug(
+                        "Device %s did not report %s=%s in time",
+                        device_id,
+                        "/".join(map(str, path)),
+                        pending.value,
+                    )
+                    del fields[path]
+                    continue
+                if device is None:
+                    continue
+                current = _get(device, path)
+                if current is _MISSING:
+                    continue
+                if _normalize(current) == _normalize(pending.value):
+                    del fields[path]  # Confirmed by the device
+                else:
+                    _set(device, path, pending.value)
+                    self.masked += 1
+            if not fields:
+                del self._pending[device_id]
+        return data
@@ -0,0 +1,319 @@
+"""Benchmark the Samsung Climate client against simulated ACs.
+
+Starts in-process simulators (see samsung_ac_simulator.py) and drives them
+with the integration's own client code, for a growing number of units:
+
+- poll latency (GET /devices plus JSON decoding, as the coordinator does)
+- command latency (PUT /devices/0)
+- TCP connect + TLS handshake time versus request time
+- config flow validation (validate_input) latency
+- event loop blocking, measured by a ticker task
+- executor jobs and busy time
+- throughput in requests per second
+
+The simulators share the event loop with the client, so loop blocking and
+throughput include the server side and are meant for comparing runs, not
+as absolute numbers. Results are written as JSON so runs can be compared
+between commits. Run it from the repository root in an environment where
+Home Assistant is installed:
+
+    python3 tools/benchmark.py --sizes 1,10,50,100,200 --output results.json
+    python3 tools/benchmark.py --latency 0.05 --handshake-delay 0.02 --no-keep-alive
+
+With ``--replay`` the units replay a recording of a real AC (see replay.py)
+instead of simulating one.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TOOLS_DIR)
+sys.path[:0] = [TOOLS_DIR, REPO_DIR]
+
+from samsung_ac_simulator import (  # noqa: E402
+    DEFAULT_CERT_PATH,
+    DEFAULT_TOKEN,
+    Faults,
+    SimulatedAC,
+)
+from replay import ReplayAC, load_recordings  # noqa: E402
+
+from custom_components.samsung_climate.api import (  # noqa: E402
+    SamsungClient,
+    async_get_ssl_context,
+)
+from custom_components.samsung_climate.config_flow import validate_input  # noqa: E402
+
+# Period of the ticker used to detect event loop blocking
+LOOP_TICK = 0.005
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted jobs and their run time."""
+
+    def __init__(self) -> None:
+        """Initialize the executor."""
+        super().__init__(thread_name_prefix="benchmark")
+        self.jobs = 0
+        self.busy = 0.0
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Submit a job, timing its execution."""
+        self.jobs += 1
+
+        def timed():
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.busy += time.perf_counter() - start
+
+        return super().submit(timed)
+
+
+class LoopMonitor:
+    """Measure how late a periodic ticker wakes up."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + LOOP_TICK
+            await asyncio.sleep(LOOP_TICK)
+            self.lags.append(max(0.0, loop.time() - expected))
+
+    def start(self) -> None:
+        """Start the ticker."""
+        self.lags.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> dict[str, float]:
+        """Stop the ticker and summarize the lag."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        return {
+            "max_ms": max(self.lags, default=0.0) * 1000,
+            "p99_ms": percentile(self.lags, 99) * 1000,
+            "blocked_ms": sum(self.lags) * 1000,
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list[float], errors: int = 0) -> dict[str, float]:
+    """Summarize latencies in milliseconds."""
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+async def timed(samples: list[float], coro) -> bool:
+    """Await coro, recording its duration on success."""
+    start = time.perf_counter()
+    try:
+        await coro
+    except Exception:  # pylint: disable=broad-except
+        return False
+    samples.append(time.perf_counter() - start)
+    return True
+
+
+async def poll(client: SamsungClient) -> None:
+    """Poll like the coordinator does."""
+    response = await client.async_request()
+    if not response.ok:
+        raise RuntimeError(f"Unexpected status {response.status}")
+    json.loads(response.body)
+
+
+async def put(client: SamsungClient) -> None:
+    """Send a command."""
+    response = await client.async_request("PUT", "/0", '{"Wind": {"speedLevel": 2}}')
+    if not response.ok:
+        raise RuntimeError(f"Unexpected status {response.status}")
+
+
+async def handshake(host: str, port: int, cert_path: str) -> None:
+    """Open and close one TLS connection."""
+    sslcontext = await async_get_ssl_context(cert_path)
+    _reader, writer = await asyncio.open_connection(host, port, ssl=sslcontext)
+    writer.close()
+
+
+async def run_size(size: int, args: argparse.Namespace, executor: CountingExecutor) -> dict:
+    """Benchmark ``size`` simulated ACs."""
+    if args.replay:
+        exchanges, setups = load_recordings(args.replay)
+        simulators = [ReplayAC(exchanges, setups) for _ in range(size)]
+    else:
+        faults = Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            handshake_delay=args.handshake_delay,
+            keep_alive=not args.no_keep_alive,
+        )
+        simulators = [SimulatedAC(args.devices, DEFAULT_TOKEN, faults) for _ in range(size)]
+    ports = [await simulator.start("127.0.0.1", 0, args.cert) for simulator in simulators]
+    clients = [SamsungClient("127.0.0.1", port, DEFAULT_TOKEN, args.cert) for port in ports]
+
+    polls: list[float] = []
+    puts: list[float] = []
+    handshakes: list[float] = []
+    validations: list[float] = []
+    errors = {"poll": 0, "put": 0, "handshake": 0, "validate": 0}
+
+    async def drive(index: int) -> None:
+        client = clients[index]
+        if not await timed(handshakes, handshake("127.0.0.1", ports[index], args.cert)):
+            errors["handshake"] += 1
+        if not await timed(
+            validations,
+            validate_input(
+                None,
+                {
+                    "host": "127.0.0.1",
+                    "port": str(ports[index]),
+                    "token": DEFAULT_TOKEN,
+                    "name": f"AC {index}",
+                    "cert_path": args.cert,
+                },
+            ),
+        ):
+            errors["validate"] += 1
+        for round_ in range(args.polls):
+            if not await timed(polls, poll(client)):
+                errors["poll"] += 1
+            if round_ < args.puts and not await timed(puts, put(client)):
+                errors["put"] += 1
+
+    jobs_before, busy_before = executor.jobs, executor.busy
+    monitor = LoopMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(drive(index) for index in range(size)))
+    elapsed = time.perf_counter() - start
+    loop_lag = await monitor.stop()
+
+    for client in clients:
+        await client.async_close()
+    for simulator in simulators:
+        await simulator.stop()
+
+    requests = len(polls) + len(puts) + len(validations)
+    return {
+        "acs": size,
+        "elapsed_s": elapsed,
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "poll": summarize(polls, errors["poll"]),
+        "put": summarize(puts, errors["put"]),
+        "handshake": summarize(handshakes, errors["handshake"]),
+        "validate": summarize(validations, errors["validate"]),
+        "connections": sum(simulator.connections for simulator in simulators),
+        "loop": loop_lag,
+        "executor": {
+            "jobs": executor.jobs - jobs_before,
+            "busy_ms": (executor.busy - busy_before) * 1000,
+        },
+    }
+
+
+def git_revision() -> str | None:
+    """Return the commit being benchmarked."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Run every benchmark size."""
+    executor = CountingExecutor()
+    asyncio.get_running_loop().set_default_executor(executor)
+    results = []
+    for size in args.sizes:
+        result = await run_size(size, args, executor)
+        print(
+            f"{size:>4} ACs: poll p50 {result['poll']['p50_ms']:.1f} ms "
+            f"p99 {result['poll']['p99_ms']:.1f} ms, "
+            f"put p50 {result['put']['p50_ms']:.1f} ms, "
+            f"handshake p50 {result['handshake']['p50_ms']:.1f} ms, "
+            f"{result['throughput_rps']:.0f} req/s, "
+            f"loop max lag {result['loop']['max_ms']:.1f} ms",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "parameters": {
+            key: value for key, value in vars(args).items() if key not in ("output", "cert")
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse the command line and run."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default="1,10,50,100,200",
+        type=lambda value: [int(size) for size in value.split(",")],
+        help="comma separated numbers of simulated ACs",
+    )
+    parser.add_argument("--polls", type=int, default=20, help="polls per AC")
+    parser.add_argument("--puts", type=int, default=5, help="commands per AC")
+    parser.add_argument("--devices", type=int, default=1, help="devices per simulated AC")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated device latency")
+    parser.add_argument("--jitter", type=float, default=0.0, help="simulated latency jitter")
+    parser.add_argument("--handshake-delay", type=float, default=0.0, help="simulated handshake delay")
+    parser.add_argument("--no-keep-alive", action="store_true", help="simulate firmware closing every connection")
+    parser.add_argument("--replay", nargs="+", metavar="RECORDING", help="replay these recordings instead of simulating")
+    parser.add_argument("--cert", default=DEFAULT_CERT_PATH)
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Serve recorded Samsung AC traffic back at its original timing.
+
+Reads the NDJSON recordings written by the integration's "Record the
+traffic" option (``<config>/samsung_climate/<host>_<port>.ndjson``) and
+answers like the recorded unit, so a slow or quirky AC from the field can
+be reproduced and benchmarked offline:
+
+- every request gets the next recorded response for the same method and
+  path, starting over when they run out, and 404 if there is none
+- the status line and headers are delayed by the recorded time to first
+  byte and the body by the recorded transfer time
+- every new connection delays the TLS handshake by the recorded connect
+  and handshake time of the next recorded connection
+- connections are kept alive only if the recorded responses were
+
+``--speed 2`` replays twice as fast. Rotated files (``.1``, ``.2``) can be
+passed as well, oldest first. The token is not checked, recordings do not
+contain it.
+
+Examples:
+
+    python3 tools/replay.py 192.168.1.20_8888.ndjson
+    python3 tools/benchmark.py --replay 192.168.1.20_8888.ndjson --sizes 1,10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+import itertools
+import json
+import logging
+
+from samsung_ac_simulator import DEFAULT_CERT_PATH, ACServer
+
+_LOGGER = logging.getLogger("replay")
+
+
+@dataclass(slots=True)
+class Exchange:
+    """One recorded response and how long the device took to send it."""
+
+    status: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+    ttfb: float
+    transfer: float
+
+
+def load_recordings(paths: list[str]) -> tuple[dict[tuple[str, str], list[Exchange]], list[float]]:
+    """Return the recorded responses by method and path, and the connection setup times."""
+    exchanges: dict[tuple[str, str], list[Exchange]] = defaultdict(list)
+    setups: list[float] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for number, line in enumerate(file, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    _LOGGER.warning("%s:%s is not valid JSON, skipped", path, number)
+                    continue
+                timing = record.get("timing", {})
+                if not record.get("reused") and timing.get("handshake"):
+                    setups.append(timing.get("connect", 0.0) + timing["handshake"])
+                if "status" not in record:
+                    continue  # The device did not answer, nothing to replay
+                exchanges[(record["method"], record["path"])].append(
+                    Exchange(
+                        record["status"],
+                        record.get("reason", ""),
+                        record.get("headers", {}),
+                        record.get("body", "").encode(),
+                        timing.get("ttfb", 0.0),
+                        timing.get("transfer", 0.0),
+                    )
+                )
+    return dict(exchanges), setups
+
+
+class ReplayAC(ACServer):
+    """Serve recorded responses with the recorded delays."""
+
+    def __init__(
+        self,
+        exchanges: dict[tuple[str, str], list[Exchange]],
+        setups: list[float] | None = None,
+        speed: float = 1.0,
+    ) -> None:
+        """Initialize the replay server."""
+        super().__init__()
+        self._exchanges = {key: itertools.cycle(values) for key, values in exchanges.items()}
+        self._setups = itertools.cycle(setups) if setups else None
+        self._speed = speed
+        self.unmatched = 0
+
+    async def _sleep(self, delay: float) -> None:
+        """Wait for a recorded delay, scaled by the replay speed."""
+        if delay > 0:
+            await asyncio.sleep(delay / self._speed)
+
+    async def before_handshake(self) -> None:
+        """Delay the handshake by the setup time of the next recorded connection."""
+        if self._setups is not None:
+            await self._sleep(next(self._setups))
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> bool:
+        """Send the next recorded response for the request."""
+        if (responses := self._exchanges.get((method, target))) is None:
+            _LOGGER.debug("No recording for %s %s", method, target)
+            self.unmatched += 1
+            exchange = Exchange(404, "Not Found", {}, b"", 0.0, 0.0)
+        else:
+            exchange = next(responses)
+
+        # The body is stored decoded, frame it with Content-Length
+        response_headers = {
+            name: value
+            for name, value in exchange.headers.items()
+            if name not in ("content-length", "transfer-encoding", "connection")
+        }
+        keep_alive = (
+            exchange.headers.get("connection", "").lower() != "close"
+            and headers.get("connection", "").lower() != "close"
+        )
+        response_headers["content-length"] = str(len(exchange.body))
+        response_headers["connection"] = "keep-alive" if keep_alive else "close"
+
+        await self._sleep(exchange.ttfb)
+        writer.write(self.response_head(exchange.status, exchange.reason, response_headers))
+        await writer.drain()
+        await self._sleep(exchange.transfer)
+        writer.write(exchange.body)
+        await writer.drain()
+        return keep_alive
+
+
+async def run_replay(args: argparse.Namespace) -> None:
+    """Serve the recordings until interrupted."""
+    exchanges, setups = load_recordings(args.recordings)
+    if not exchanges:
+        raise SystemExit("The recordings contain no responses")
+    for (method, path), responses in sorted(exchanges.items()):
+        print(f"{method} {path}: {len(responses)} recorded response(s)")
+    server = ReplayAC(exchanges, setups, args.speed)
+    port = await server.start(args.host, args.port, args.cert)
+    print(f"Replaying on {args.host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Parse the command line and run."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recordings", nargs="+", help="NDJSON recordings, oldest first")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--cert", default=DEFAULT_CERT_PATH, help="PEM with key and certificate")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(run_replay(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+"""Asyncio TLS simulator of the Samsung air conditioner REST API.
+
+Emulates the port 8888 API used by the integration so it can be tested and
+benchmarked without hardware:
+
+    GET  /devices
+    GET  /devices/{id}
+    PUT  /devices/{id}
+    PUT  /devices/{id}/temperatures/0
+
+Requests must carry ``Authorization: Bearer <token>``. Connections are kept
+alive unless ``--no-keep-alive`` is given. Latency, handshake delay and
+dropped connections can be injected, and ``--count`` starts several units
+on consecutive ports. With ``--push-to`` every state change is also POSTed
+as ``{"Device": ...}`` to that address, for the integration's local push
+mode.
+
+It also replaces the old Python 2 ``Server8889.py``: ``--token-capture``
+listens on port 8889 and prints every request the AC sends, which is how the
+device token is obtained (see README).
+
+Examples:
+
+    python3 tools/samsung_ac_simulator.py --devices 2 --latency 0.05
+    python3 tools/samsung_ac_simulator.py --count 50 --port 9000
+    python3 tools/samsung_ac_simulator.py --push-to 192.168.1.10:8889
+    python3 tools/samsung_ac_simulator.py --token-capture
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from copy import deepcopy
+from dataclasses import dataclass
+import json
+import logging
+import os
+import random
+import socket
+import ssl
+
+_LOGGER = logging.getLogger("samsung_ac_simulator")
+
+DEFAULT_CERT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    "custom_components",
+    "samsung_climate",
+    "ac14k_m.pem",
+)
+DEFAULT_TOKEN = "simulator-token"
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+def create_server_ssl_context(cert_path: str = DEFAULT_CERT_PATH) -> ssl.SSLContext:
+    """Create a server SSL context as permissive as the AC firmware."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.set_ciphers("DEFAULT:@SECLEVEL=0")
+    context.minimum_version = ssl.TLSVersion.TLSv1
+    context.load_cert_chain(cert_path)
+    return context
+
+
+def create_client_ssl_context() -> ssl.SSLContext:
+    """Create the client SSL context used to send notifications."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.set_ciphers("DEFAULT:@SECLEVEL=0")
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def device_payload(device_id: str) -> dict:
+    """Return a device as reported by GET /devices."""
+    return {
+        "Alarms": [
+            {
+                "alarmType": "Device",
+                "code": "FilterAlarm",
+                "id": "0",
+                "triggeredTime": "2017-06-03T00:55:09",
+            }
+        ],
+        "ConfigurationLink": {"href": f"/devices/{device_id}/configuration"},
+        "Diagnosis": {"diagnosisStart": "Ready"},
+        "EnergyConsumption": {"saveLocation": "/files/usage.db"},
+        "InformationLink": {"href": f"/devices/{device_id}/information"},
+        "Mode": {
+            "modes": ["Cool"],
+            "options": [
+                "Comode_Off",
+                "Sleep_0",
+                "Autoclean_Off",
+                "Spi_Off",
+                "FilterCleaning_Off",
+                "OutdoorTemp_63",
+                "CoolCapa_35",
+                "WarmCapa_40",
+                "UsagesDB_254",
+                "FilterTime_10000",
+                "OptionCode_54458",
+                "UpdateAllow_0",
+                "FilterAlarmTime_500",
+                "Function_15",
+                "Volume_100",
+            ],
+            "supportedModes": ["Cool", "Dry", "Wind", "Auto", "Heat"],
+        },
+        "Operation": {"power": "Off"},
+        "Temperatures": [
+            {
+                "current": 24.0,
+                "desired": 24.0,
+                "id": "0",
+                "maximum": 30,
+                "minimum": 16,
+                "name": "Temperature",
+                "unit": "Celsius",
+            }
+        ],
+        "Wind": {
+            "direction": "Fix",
+            "maxSpeedLevel": 4,
+            "speedLevel": 0,
+            "supportedWindDirections": ["All", "Up_And_Low", "Left_And_Right", "Fix"],
+        },
+        "connected": True,
+        "description": "TP6X_RAC_16K",
+        "id": device_id,
+        "name": "RAC",
+        "resources": [
+            "Alarms",
+            "Configuration",
+            "Diagnosis",
+            "EnergyConsumption",
+            "Information",
+            "Mode",
+            "Operation",
+            "Temperatures",
+            "Wind",
+        ],
+        "type": "Air_Conditioner",
+        "uuid": f"C0972729-EB73-0000-0000-{int(device_id):012d}",
+    }
+
+
+def merge(target: dict, changes: dict) -> None:
+    """Apply a PUT body to a device resource."""
+    for key, value in changes.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge(current, value)
+        elif key == "Temperatures" and isinstance(current, list) and value:
+            merge(current[0], value[0])
+        else:
+            target[key] = value
+
+
+@dataclass
+class Faults:
+    """Faults injected into every exchange."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    handshake_delay: float = 0.0
+    drop_rate: float = 0.0
+    keep_alive: bool = True
+
+
+class ACServer:
+    """TLS HTTP/1.1 server with the connection handling of the AC.
+
+    Subclasses answer the requests in respond() and may delay the TLS
+    handshake in before_handshake().
+    """
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.connections = 0
+        self.requests = 0
+        self._ssl_context: ssl.SSLContext | None = None
+        self._listener: socket.socket | None = None
+        self._accept_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 8888, cert_path: str = DEFAULT_CERT_PATH
+    ) -> int:
+        """Start listening, return the bound port."""
+        self._ssl_context = create_server_ssl_context(cert_path)
+        self._listener = socket.create_server((host, port))
+        self._listener.setblocking(False)
+        self._accept_task = asyncio.create_task(self._accept_loop())
+        return self._listener.getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and drop open connections."""
+        if self._accept_task is None:
+            return
+        self._accept_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(self._accept_task, *self._tasks, return_exceptions=True)
+        self._listener.close()
+        self._accept_task = None
+
+    def _create_task(self, coro) -> None:
+        """Run coro in the background until it is done or the server stops."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def before_handshake(self) -> None:
+        """Wait before the TLS handshake of a new connection."""
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> bool:
+        """Answer one request, return True if the connection stays open."""
+        raise NotImplementedError
+
+    @staticmethod
+    def response_head(status: int, reason: str, headers: dict[str, str]) -> bytes:
+        """Return the status line and headers of a response."""
+        return (
+            f"HTTP/1.1 {status} {reason}\r\n"
+            + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+            + "\r\n"
+        ).encode("latin-1")
+
+    async def _accept_loop(self) -> None:
+        """Accept connections on the listening socket."""
+        loop = asyncio.get_running_loop()
+        while True:
+            sock, _ = await loop.sock_accept(self._listener)
+            self._create_task(self._handle_connection(sock))
+
+    async def _handle_connection(self, sock: socket.socket) -> None:
+        """Serve every request sent on one connection."""
+        self.connections += 1
+        # The ClientHello waits in the socket buffer meanwhile
+        await self.before_handshake()
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        try:
+            transport, _ = await loop.connect_accepted_socket(
+                lambda: protocol, sock, ssl=self._ssl_context
+            )
+        except (ConnectionError, ssl.SSLError):
+            sock.close()
+            return
+
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, ssl.SSLError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Read one request and answer it, return True if the connection stays open."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return False
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, target, _version = request_line.split(" ", 2)
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        self.requests += 1
+        return await self.respond(writer, method, target, headers, body)
+
+
+class SimulatedAC(ACServer):
+    """One simulated AC host exposing one or more devices."""
+
+    def __init__(
+        self,
+        devices: int = 1,
+        token: str = DEFAULT_TOKEN,
+        faults: Faults | None = None,
+        push_to: tuple[str, int] | None = None,
+    ) -> None:
+        """Initialize the simulator."""
+        super().__init__()
+        self.devices = {str(index): device_payload(str(index)) for index in range(devices)}
+        self.token = token
+        self.faults = faults or Faults()
+        self.push_to = push_to
+        self.notifications = 0
+
+    def set_state(self, device_id: str, changes: dict) -> None:
+        """Change a device as the IR remote would, notifying the push target."""
+        merge(self.devices[device_id], deepcopy(changes))
+        self._schedule_notification(device_id)
+
+    def _schedule_notification(self, device_id: str) -> None:
+        """Send the device state to the push target in the background."""
+        if self.push_to is not None:
+            self._create_task(self._notify(device_id))
+
+    async def _notify(self, device_id: str) -> None:
+        """POST the state of a device to the push target."""
+        body = json.dumps({"Device": self.devices[device_id]}).encode()
+        host, port = self.push_to
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=create_client_ssl_context()
+            )
+            writer.write(
+                (
+                    "POST /notifications HTTP/1.1\r\n"
+                    f"Host: {host}:{port}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + body
+            )
+            await writer.drain()
+            await reader.read()
+            writer.close()
+        except (OSError, ssl.SSLError) as ex:
+            _LOGGER.debug("Notification to %s:%s failed: %s", host, port, ex)
+            return
+        self.notifications += 1
+
+    async def before_handshake(self) -> None:
+        """Apply the injected handshake delay."""
+        if self.faults.handshake_delay:
+            await asyncio.sleep(self.faults.handshake_delay)
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> bool:
+        """Answer a request from the emulated resources."""
+        if random.random() < self.faults.drop_rate:
+            return False
+        if delay := self.faults.latency + random.uniform(0, self.faults.jitter):
+            await asyncio.sleep(delay)
+
+        status, payload = self._dispatch(method, target, headers, body)
+        keep_alive = (
+            self.faults.keep_alive and headers.get("connection", "").lower() != "close"
+        )
+        response_headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(payload)),
+            "Connection": "keep-alive" if keep_alive else "close",
+        }
+        writer.write(self.response_head(status, REASONS[status], response_headers) + payload)
+        await writer.drain()
+        return keep_alive
+
+    def _dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, bytes]:
+        """Route a request to the emulated resources."""
+        if headers.get("authorization") != f"Bearer {self.token}":
+            return 401, b""
+
+        parts = target.strip("/").split("/")
+        if parts[0] != "devices":
+            return 404, b""
+
+        if len(parts) == 1:
+            if method != "GET":
+                return 405, b""
+            return 200, json.dumps({"Devices": list(self.devices.values())}).encode()
+
+        if (device := self.devices.get(parts[1])) is None:
+            return 404, b""
+
+        if method == "GET" and len(parts) == 2:
+            return 200, json.dumps({"Device": device}).encode()
+        if method != "PUT":
+            return 405, b""
+
+        try:
+            changes = json.loads(body)
+        except ValueError:
+            return 400, b""
+        if len(parts) == 2:
+            merge(device, deepcopy(changes))
+        elif parts[2:] == ["temperatures", "0"]:
+            merge(device["Temperatures"][0], changes)
+        else:
+            return 404, b""
+        _LOGGER.debug("Device %s updated: %s", parts[1], changes)
+        self._schedule_notification(parts[1])
+        return 200, b""
+
+
+async def run_token_capture(host: str, port: int, cert_path: str) -> None:
+    """Print every request the AC sends to port 8889."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n"):
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            body = await reader.readexactly(length)
+            print("\n----- Request Start ----->\n")
+            print(head.decode("latin-1"))
+            print(body.decode("utf-8", errors="replace"))
+            print("<----- Request End -----\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(
+        handle, host, port, ssl=create_server_ssl_context(cert_path)
+    )
+    print(f"Listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+async def run_simulators(args: argparse.Namespace) -> None:
+    """Start the simulated units and serve until interrupted."""
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        handshake_delay=args.handshake_delay,
+        drop_rate=args.drop_rate,
+        keep_alive=not args.no_keep_alive,
+    )
+    push_to = None
+    if args.push_to:
+        push_host, _, push_port = args.push_to.partition(":")
+        push_to = (push_host, int(push_port or 8889))
+    simulators = []
+    for index in range(args.count):
+        simulator = SimulatedAC(args.devices, args.token, faults, push_to)
+        port = await simulator.start(args.host, args.port + index, args.cert)
+        print(f"Simulated AC with {args.devices} device(s) on {args.host}:{port}")
+        simulators.append(simulator)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for simulator in simulators:
+            await simulator.stop()
+
+
+def main() -> None:
+    """Parse the command line and run."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, help="first port (8888, or 8889 with --token-capture)")
+    parser.add_argument("--cert", default=DEFAULT_CERT_PATH, help="PEM with key and certificate")
+    parser.add_argument("--token", default=DEFAULT_TOKEN, help="accepted bearer token")
+    parser.add_argument("--count", type=int, default=1, help="number of simulated units")
+    parser.add_argument("--devices", type=int, default=1, help="devices reported per unit")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay in seconds")
+    parser.add_argument("--handshake-delay", type=float, default=0.0, help="delay before the TLS handshake")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="probability of dropping a request")
+    parser.add_argument("--no-keep-alive", action="store_true", help="close after every response")
+    parser.add_argument("--push-to", metavar="HOST[:PORT]", help="send state notifications to this address")
+    parser.add_argument("--token-capture", action="store_true", help="print requests sent to port 8889")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        if args.token_capture:
+            asyncio.run(run_token_capture(args.host, args.port or 8889, args.cert))
+        else:
+            args.port = args.port or 8888
+            asyncio.run(run_simulators(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()